@@ -19,8 +19,7 @@ Requirements:
 import os
 from datetime import datetime, timedelta
 
-from psdl.parser import PSDLParser
-from psdl.execution import PSDLEvaluator
+from psdl import PSDLEvaluator, PSDLParser
 from psdl.adapters.omop import OMOPBackend, OMOPConfig
 
 
@@ -86,32 +85,51 @@ def main():
     reference_time = datetime(2023, 12, 31, 23, 59, 59)
     print(f"\nEvaluating at: {reference_time}")
 
+    # Screen in-database first: the compiled cohort SQL computes trends and
+    # logic server-side and returns only triggered person_ids
+    try:
+        screened = set(backend.screen_cohort(scenario, reference_time=reference_time))
+        patients = [p for p in patients if str(p) in screened]
+        print(f"  SQL screen: {len(patients)} candidate patients")
+    except Exception as e:
+        print(f"  SQL screen unavailable ({e}), evaluating all patients")
+
     # Track results
     triggered_patients = []
     aki_stages = {"aki_stage1": 0, "aki_stage2": 0, "aki_stage3": 0}
+    stage_names = set(aki_stages)
 
-    for patient_id in patients[:100]:  # Limit for demo
-        try:
-            result = evaluator.evaluate_patient(
-                patient_id=patient_id,
-                reference_time=reference_time
-            )
-
-            if result.is_triggered:
-                triggered_patients.append({
-                    "patient_id": patient_id,
-                    "logic": result.triggered_logic,
-                    "cr_value": result.trend_values.get("cr_elevated"),
-                })
-
-                # Count AKI stages
-                for stage in ["aki_stage1", "aki_stage2", "aki_stage3"]:
-                    if stage in result.triggered_logic:
-                        aki_stages[stage] += 1
-
-        except Exception as e:
-            # Skip patients with missing data
-            continue
+    # One query per signal for the whole cohort instead of one per patient;
+    # signals are fetched concurrently (keep workers <= config.pool_size)
+    try:
+        results = evaluator.evaluate_batch(
+            patient_ids=patients[:100],  # Limit for demo
+            reference_time=reference_time,
+            max_workers=min(len(scenario.signals), config.pool_size),
+        )
+    except Exception as e:
+        # Fall back to one patient at a time, skipping patients with missing data
+        print(f"  Batch evaluation failed ({e}), evaluating patients individually")
+        results = []
+        for patient_id in patients[:100]:
+            try:
+                results.append(
+                    evaluator.evaluate_patient(patient_id=patient_id, reference_time=reference_time)
+                )
+            except Exception:
+                continue
+
+    for result in results:
+        if result.is_triggered:
+            triggered_patients.append({
+                "patient_id": result.patient_id,
+                "logic": result.triggered_logic,
+                "cr_value": result.trend_values.get("cr_elevated"),
+            })
+
+            # Count AKI stages
+            for stage in stage_names.intersection(result.triggered_logic):
+                aki_stages[stage] += 1
 
     # ─────────────────────────────────────────────────────────────
     # 5. Report Results
@@ -150,20 +168,17 @@ def main():
         start_time = end_time - timedelta(days=30)
         step = timedelta(hours=12)
 
-        timeline_events = []
-        current = start_time
-
-        while current <= end_time:
-            try:
-                result = evaluator.evaluate_patient(patient_id, current)
-                if result.is_triggered:
-                    timeline_events.append({
-                        "time": current,
-                        "logic": result.triggered_logic,
-                    })
-            except Exception:
-                pass
-            current += step
+        # One fetch per signal for the whole span, then sliced per step
+        try:
+            timeline = evaluator.evaluate_timeline(patient_id, start_time, end_time, step)
+        except Exception:
+            timeline = []
+
+        timeline_events = [
+            {"time": result.timestamp, "logic": result.triggered_logic}
+            for result in timeline
+            if result.is_triggered
+        ]
 
         if timeline_events:
             print(f"Found {len(timeline_events)} trigger events in 30 days:")
@@ -72,7 +72,13 @@ from .expression_parser import (
     parse_logic_expression,
     parse_trend_expression,
 )
-from .operators import DataPoint, TemporalOperators
+from .operators import (
+    DataPoint,
+    DataSeries,
+    SlidingWindowAggregator,
+    TemporalOperators,
+    WindowSummary,
+)
 
 # Runtimes
 from .runtimes.single import InMemoryBackend, SinglePatientEvaluator
@@ -115,7 +121,10 @@ __all__ = [
     "PSDLScenario",
     "parse_scenario",
     "DataPoint",
+    "DataSeries",
+    "SlidingWindowAggregator",
     "TemporalOperators",
+    "WindowSummary",
     # v0.3 Compiler (RFC-0006)
     "compile_scenario",
     "ScenarioCompiler",
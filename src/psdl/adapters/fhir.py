@@ -18,10 +18,13 @@ Usage:
     result = evaluator.evaluate_patient(patient_id="patient-uuid")
 """
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 try:
     import requests
@@ -32,7 +35,7 @@ except ImportError:
     REQUESTS_AVAILABLE = False
 
 from ..core.ir import Signal
-from ..operators import DataPoint
+from ..operators import DataPoint, window_delta
 from ..runtimes.single import DataBackend
 
 if TYPE_CHECKING:
@@ -79,6 +82,14 @@ LOINC_CODES = {
     "gcs": "9269-2",
 }
 
+# The usual FHIR instant/dateTime shapes, parsed without strptime: a date, or
+# a date and time with an optional "Z"/"+00:00" (UTC) suffix, which a
+# fractional second requires
+_FHIR_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})(?=Z|\+00:00))?(?:Z|\+00:00)?)?"
+)
+
 
 @dataclass
 class FHIRConfig:
@@ -93,6 +104,13 @@ class FHIRConfig:
         verify_ssl: Whether to verify SSL certificates
         headers: Additional HTTP headers
         loinc_mappings: Override LOINC code mappings for signals
+        max_concurrent_requests: Parallel searches when fetching a signal for
+            many patients (fetch_signal_data_batch); 1 fetches serially
+        max_retries: Retries (with exponential backoff) for GETs that fail to
+            connect or return 429/5xx; 0 disables
+        page_size: Results requested per search page, both Patients in
+            get_patient_ids and Observations in the combined
+            fetch_patient_signals search; servers may cap it lower
     """
 
     base_url: str
@@ -102,6 +120,9 @@ class FHIRConfig:
     verify_ssl: bool = True
     headers: Dict[str, str] = field(default_factory=dict)
     loinc_mappings: Dict[str, str] = field(default_factory=dict)
+    max_concurrent_requests: int = 8
+    max_retries: int = 3
+    page_size: int = 1000
 
     def __post_init__(self):
         # Remove trailing slash from base_url
@@ -156,10 +177,19 @@ class FHIRBackend(DataBackend):
         self.mapping = mapping
         self.dataset_spec = dataset_spec
         self._session = None
+        # Resolved LOINC code per (signal name, source); see _get_loinc_code
+        self._loinc_cache: Dict[Tuple[str, str], Optional[str]] = {}
 
     @property
     def capabilities(self) -> Set[str]:
-        """FHIRBackend capabilities."""
+        """
+        FHIRBackend capabilities.
+
+        batch_fetch is not declared: FHIR search is per patient, so prefetching
+        signal by signal would cost one search per (patient, signal), while
+        evaluate() fetches each patient's Observations in one combined search
+        (fetch_patient_signals).
+        """
         return set()
 
     def _get_session(self):
@@ -198,6 +228,22 @@ class FHIRBackend(DataBackend):
             # SSL verification
             self._session.verify = self.config.verify_ssl
 
+            # Pool enough connections for concurrent batch searches, and retry
+            # throttled / transiently failing searches with backoff
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=self.config.max_retries,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=max(10, self.config.max_concurrent_requests), max_retries=retry
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
         return self._session
 
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
@@ -212,6 +258,45 @@ class FHIRBackend(DataBackend):
         except Exception as e:
             raise RuntimeError(f"FHIR request failed: {e}")
 
+    def _get_page(self, url: str) -> Dict:
+        """Fetch a search result page by the full URL from a Bundle link."""
+        session = self._get_session()
+
+        try:
+            response = session.get(url, timeout=self.config.timeout)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise RuntimeError(f"FHIR request failed: {e}")
+
+    def _search_entries(self, resource_type: str, params: Dict[str, Any]) -> List[Dict]:
+        """
+        Run a search and collect the entries of every result page.
+
+        Follows the Bundle "next" links until the last page.
+
+        Raises:
+            RuntimeError: If a request fails or a page is not a Bundle
+        """
+        entries: List[Dict] = []
+        bundle = self._make_request(resource_type, params)
+
+        while True:
+            if bundle.get("resourceType") != "Bundle":
+                raise RuntimeError(
+                    f"FHIR search returned {bundle.get('resourceType')!r}, expected a Bundle"
+                )
+            entries.extend(bundle.get("entry", []))
+
+            next_url = None
+            for link in bundle.get("link", []):
+                if link.get("relation") == "next":
+                    next_url = link.get("url")
+                    break
+            if not next_url:
+                return entries
+            bundle = self._get_page(next_url)
+
     def _get_loinc_code(self, signal: Signal) -> Optional[str]:
         """
         Get LOINC code for a signal.
@@ -221,7 +306,17 @@ class FHIRBackend(DataBackend):
         2. Config-level loinc_mappings override
         3. Signal source name lookup in LOINC_CODES
         4. Signal source if it looks like a LOINC code
+
+        The result is memoized per signal: a cohort fetch resolves the same
+        signal once per patient.
         """
+        key = (signal.name, signal.source)
+        if key not in self._loinc_cache:
+            self._loinc_cache[key] = self._resolve_loinc_code(signal)
+        return self._loinc_cache[key]
+
+    def _resolve_loinc_code(self, signal: Signal) -> Optional[str]:
+        """Look up a signal's LOINC code (uncached; see _get_loinc_code)."""
         # Check MappingProvider first (new recommended approach)
         if self.mapping is not None:
             loinc_code = self.mapping.get_loinc_code(signal.source or signal.name)
@@ -250,7 +345,25 @@ class FHIRBackend(DataBackend):
         if not value:
             return None
 
-        # FHIR datetime formats
+        match = _FHIR_DATETIME.fullmatch(value)
+        if match:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            try:
+                if hour is None:
+                    return datetime(int(year), int(month), int(day))
+                return datetime(
+                    int(year),
+                    int(month),
+                    int(day),
+                    int(hour),
+                    int(minute),
+                    int(second),
+                    int(fraction.ljust(6, "0")) if fraction else 0,
+                )
+            except ValueError:
+                pass
+
+        # Other FHIR datetime formats (e.g. non-UTC offsets)
         formats = [
             "%Y-%m-%dT%H:%M:%S.%fZ",
             "%Y-%m-%dT%H:%M:%SZ",
@@ -260,9 +373,10 @@ class FHIRBackend(DataBackend):
             "%Y-%m-%d",
         ]
 
+        value = value.replace("+00:00", "Z")
         for fmt in formats:
             try:
-                return datetime.strptime(value.replace("+00:00", "Z"), fmt)
+                return datetime.strptime(value, fmt)
             except ValueError:
                 continue
 
@@ -335,19 +449,14 @@ class FHIRBackend(DataBackend):
         Returns:
             List of DataPoints sorted by timestamp (ascending)
         """
-        domain = signal.domain.value if signal.domain else "measurement"
+        domain = signal.domain_str
         resource_type = DOMAIN_RESOURCE_MAP.get(domain, FHIRResourceType.OBSERVATION).value
 
-        window_start = reference_time - timedelta(seconds=window_seconds)
-
         # Build search parameters
         params = {
             "patient": patient_id,
             "_sort": "date",
-            "date": [
-                f"ge{window_start.strftime('%Y-%m-%dT%H:%M:%S')}",
-                f"le{reference_time.strftime('%Y-%m-%dT%H:%M:%S')}",
-            ],
+            "date": self._date_range(window_seconds, reference_time),
         }
 
         # Add code filter for Observations
@@ -385,10 +494,147 @@ class FHIRBackend(DataBackend):
                             data_points.append(DataPoint(timestamp=timestamp, value=1.0))
 
         # Sort by timestamp
-        data_points.sort(key=lambda dp: dp.timestamp)
+        data_points.sort(key=attrgetter("timestamp"))
 
         return data_points
 
+    def _date_range(self, window_seconds: int, reference_time: datetime) -> List[str]:
+        """FHIR date search bounds for the window ending at reference_time."""
+        window_start = reference_time - window_delta(window_seconds)
+        return [
+            f"ge{window_start.strftime('%Y-%m-%dT%H:%M:%S')}",
+            f"le{reference_time.strftime('%Y-%m-%dT%H:%M:%S')}",
+        ]
+
+    def fetch_patient_signals(
+        self,
+        patient_id: Any,
+        signals: Dict[str, Signal],
+        window_seconds: int,
+        reference_time: datetime,
+    ) -> Dict[str, List[DataPoint]]:
+        """
+        Fetch several signals for one patient, Observations in one search.
+
+        Observation signals with a LOINC code are requested together
+        (a comma-separated code parameter matches any of the codes),
+        following the result pages, and split by code locally, so a
+        scenario costs one search instead of one per signal. Other signals
+        use fetch_signal_data(), as do all signals if the combined search
+        fails.
+
+        Args:
+            patient_id: FHIR Patient ID
+            signals: Signal definitions keyed by signal name
+            window_seconds: How far back to fetch
+            reference_time: End of the time window
+
+        Returns:
+            Dict mapping every signal name to its DataPoints sorted by
+            timestamp (ascending)
+        """
+        names_by_code: Dict[str, List[str]] = {}
+        others: Dict[str, Signal] = {}
+        for name, signal in signals.items():
+            resource_type = DOMAIN_RESOURCE_MAP.get(
+                signal.domain_str, FHIRResourceType.OBSERVATION
+            ).value
+            loinc_code = self._get_loinc_code(signal) if resource_type == "Observation" else None
+            if loinc_code:
+                names_by_code.setdefault(loinc_code, []).append(name)
+            else:
+                others[name] = signal
+
+        if len(names_by_code) < 2:
+            # Nothing to combine
+            return super().fetch_patient_signals(
+                patient_id, signals, window_seconds, reference_time
+            )
+
+        params = {
+            "patient": patient_id,
+            "code": ",".join(f"http://loinc.org|{code}" for code in names_by_code),
+            "date": self._date_range(window_seconds, reference_time),
+            "_count": self.config.page_size,
+        }
+        try:
+            entries = self._search_entries("Observation", params)
+        except RuntimeError:
+            # Search signal by signal instead, as if nothing were combined
+            return super().fetch_patient_signals(
+                patient_id, signals, window_seconds, reference_time
+            )
+
+        fetched = super().fetch_patient_signals(patient_id, others, window_seconds, reference_time)
+        points_by_code: Dict[str, List[DataPoint]] = {code: [] for code in names_by_code}
+
+        for entry in entries:
+            resource = entry.get("resource", {})
+            if resource.get("resourceType") != "Observation":
+                continue
+            codes = {
+                coding.get("code")
+                for coding in resource.get("code", {}).get("coding", [])
+                if coding.get("system") == "http://loinc.org"
+            }
+            matched = [points_by_code[code] for code in codes if code in points_by_code]
+            if not matched:
+                continue
+
+            value = self._extract_observation_value(resource)
+            timestamp = self._extract_observation_datetime(resource)
+            if value is not None and timestamp is not None:
+                for points in matched:
+                    points.append(DataPoint(timestamp=timestamp, value=value))
+
+        for code, names in names_by_code.items():
+            points = points_by_code[code]
+            points.sort(key=attrgetter("timestamp"))
+            for name in names:
+                fetched[name] = list(points)
+
+        return {name: fetched[name] for name in signals}
+
+    def fetch_signal_data_batch(
+        self,
+        patient_ids: List[Any],
+        signal: Signal,
+        window_seconds: int,
+        reference_time: datetime,
+    ) -> Dict[Any, List[DataPoint]]:
+        """
+        Fetch a signal for many patients with concurrent searches.
+
+        FHIR search is per patient, so a cohort costs one round-trip per
+        patient; these are latency bound, so up to max_concurrent_requests of
+        them run at once over the shared session instead of one after another.
+
+        Args:
+            patient_ids: FHIR Patient IDs
+            signal: Signal definition
+            window_seconds: How far back to fetch
+            reference_time: End of the time window
+
+        Returns:
+            Dict mapping every requested patient ID to its DataPoints
+            sorted by timestamp (ascending)
+        """
+        workers = min(self.config.max_concurrent_requests, len(patient_ids))
+        if workers <= 1:
+            return super().fetch_signal_data_batch(
+                patient_ids, signal, window_seconds, reference_time
+            )
+
+        # Create the session up front rather than racing to in the workers
+        self._get_session()
+
+        def fetch(patient_id: Any) -> List[DataPoint]:
+            return self.fetch_signal_data(patient_id, signal, window_seconds, reference_time)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(fetch, patient_ids)
+            return dict(zip(patient_ids, results))
+
     def get_patient_ids(
         self,
         population_include: Optional[List[str]] = None,
@@ -398,7 +644,8 @@ class FHIRBackend(DataBackend):
         Get patient IDs from FHIR server.
 
         Note: Population filter parsing is not yet implemented.
-        Returns all patient IDs from the server (paginated).
+        Returns all patient IDs from the server, paging through an
+        id-only search config.page_size patients at a time.
 
         Args:
             population_include: Inclusion criteria (not yet implemented)
@@ -408,16 +655,13 @@ class FHIRBackend(DataBackend):
             List of patient IDs
         """
         patient_ids = []
-        next_url = "Patient?_elements=id&_count=100"
+        next_url = f"Patient?_elements=id&_count={self.config.page_size}"
 
         while next_url:
             try:
                 if next_url.startswith("http"):
                     # Full URL from pagination
-                    session = self._get_session()
-                    response = session.get(next_url, timeout=self.config.timeout)
-                    response.raise_for_status()
-                    bundle = response.json()
+                    bundle = self._get_page(next_url)
                 else:
                     bundle = self._make_request(next_url)
 
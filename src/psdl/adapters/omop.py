@@ -54,17 +54,30 @@ Legacy Usage (config-level mappings):
 """
 
 import re
+import warnings
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import TextClause
+
     from ..mapping import MappingProvider
 
 from ..core.dataset import Binding, DatasetSpec, Event
 from ..core.ir import Signal
-from ..operators import DataPoint
+from ..operators import DataPoint, window_delta
 from ..runtimes.batch import BatchResult, BatchRuntime
 from ..runtimes.single import DataBackend
 
@@ -97,6 +110,21 @@ DOMAIN_TABLE_MAP = {
     "procedure": "procedure_occurrence",
 }
 
+# Event time columns per domain: (datetime column, date-only column)
+DOMAIN_DATETIME_COLUMNS = {
+    "measurement": ("measurement_datetime", "measurement_date"),
+    "observation": ("observation_datetime", "observation_date"),
+    "condition": ("condition_start_datetime", "condition_start_date"),
+    "drug": ("drug_exposure_start_datetime", "drug_exposure_start_date"),
+    "procedure": ("procedure_datetime", "procedure_date"),
+}
+
+# Numeric value column per domain; other domains report presence as 1.0
+DOMAIN_VALUE_COLUMNS = {
+    "measurement": "value_as_number",
+    "observation": "value_as_number",
+}
+
 
 @dataclass
 class OMOPConfig:
@@ -114,6 +142,15 @@ class OMOPConfig:
         use_datetime: Use datetime fields instead of date fields (default: True)
         use_source_values: Use source_value instead of concept_id for lookups (default: False)
             Useful for OMOP databases with unmapped concepts
+        pool_size: Connections kept open in the SQLAlchemy pool (default: 25)
+        max_overflow: Extra connections allowed beyond pool_size (default: 25)
+        pool_pre_ping: Test connections before checkout (default: True)
+        pool_recycle: Seconds after which pooled connections are replaced (default: 1800)
+            Pool settings are ignored for SQLite. Keep pool_size + max_overflow
+            below the server's max_connections.
+
+    Signal fetches filter on (person_id, concept_id, event time); run
+    OMOPBackend.check_indexes() once to confirm the CDM has a matching index.
     """
 
     connection_string: str
@@ -126,6 +163,11 @@ class OMOPConfig:
     concept_mappings: Dict[str, int] = field(default_factory=dict)
     # Optional source value overrides for signals (when use_source_values=True)
     source_value_mappings: Dict[str, str] = field(default_factory=dict)
+    # Connection pool settings (passed to sqlalchemy.create_engine)
+    pool_size: int = 25
+    max_overflow: int = 25
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
 
     def __post_init__(self):
         if self.vocab_schema is None:
@@ -189,6 +231,10 @@ class OMOPBackend(DataBackend, BatchRuntime):
         self.mapping = mapping
         self._engine = None
         self._connection = None
+        self._query_cache: Dict[Tuple, "TextClause"] = {}
+        # Resolved concept_id / source_value per signal (see _signal_key)
+        self._concept_cache: Dict[Tuple, int] = {}
+        self._source_cache: Dict[Tuple, str] = {}
 
         # If dataset_spec provided, use its conventions
         if dataset_spec is not None:
@@ -202,8 +248,8 @@ class OMOPBackend(DataBackend, BatchRuntime):
 
     @property
     def capabilities(self) -> Set[str]:
-        """OMOPBackend supports dataset_adapter and sql capabilities."""
-        return {"dataset_adapter", "sql"}
+        """OMOPBackend supports dataset_adapter, sql and batch_fetch capabilities."""
+        return {"dataset_adapter", "sql", "batch_fetch"}
 
     def connect(self) -> None:
         """Eagerly initialize the database engine."""
@@ -215,7 +261,9 @@ class OMOPBackend(DataBackend, BatchRuntime):
             try:
                 from sqlalchemy import create_engine
 
-                self._engine = create_engine(self.config.connection_string)
+                self._engine = create_engine(
+                    self.config.connection_string, **self._engine_options()
+                )
             except ImportError:
                 raise ImportError(
                     "SQLAlchemy is required for OMOP backend. "
@@ -223,16 +271,79 @@ class OMOPBackend(DataBackend, BatchRuntime):
                 )
         return self._engine
 
-    def _execute_query(self, query: str, params: Dict[str, Any]) -> List[Dict]:
-        """Execute SQL query and return results as list of dicts."""
+    def _engine_options(self) -> Dict[str, Any]:
+        """Connection pool options for create_engine()."""
+        # SQLite uses a single-connection/file pool that takes no sizing options
+        if self.config.connection_string.startswith("sqlite"):
+            return {}
+        return {
+            "pool_size": self.config.pool_size,
+            "max_overflow": self.config.max_overflow,
+            "pool_pre_ping": self.config.pool_pre_ping,
+            "pool_recycle": self.config.pool_recycle,
+        }
+
+    # Rows fetched per round-trip when streaming query results
+    STREAM_CHUNK_SIZE = 10_000
+
+    def _execute_query(
+        self,
+        query: Union[str, "TextClause"],
+        params: Dict[str, Any],
+        stream: bool = True,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Execute SQL query and stream result rows as tuples.
+
+        Rows are read through a server-side cursor in chunks of
+        STREAM_CHUNK_SIZE, so callers process them as they arrive instead of
+        holding the full result set in memory. The connection stays open until
+        the iterator is exhausted. Rows are SQLAlchemy Row objects: unpack
+        them positionally in SELECT order (or use attribute access) rather
+        than building a dict per row.
+
+        Args:
+            query: SQL text with named parameters, or a prebuilt TextClause
+                (see _build_signal_query) to skip re-parsing
+            params: Parameter values
+            stream: Use a server-side cursor. Pass False for queries known to
+                return few rows (one patient's signal window): a named cursor
+                costs extra round trips on PostgreSQL that a small result
+                never pays back.
+        """
+        engine = self._get_engine()
+        try:
+            from sqlalchemy import text
+
+            statement = text(query) if isinstance(query, str) else query
+
+            with engine.connect() as conn:
+                if not stream:
+                    yield from conn.execute(statement, params)
+                    return
+                result = conn.execution_options(
+                    stream_results=True, yield_per=self.STREAM_CHUNK_SIZE
+                ).execute(statement, params)
+                for partition in result.partitions():
+                    yield from partition
+        except Exception as e:
+            raise RuntimeError(f"Query execution failed: {e}")
+
+    def _execute_scalars(self, query: str, params: Dict[str, Any]) -> List[Any]:
+        """Execute SQL query and return the first column as a flat list.
+
+        For single-column results such as person_id lists: values come straight
+        from the cursor without building a Row per result.
+
+        Args:
+            query: SQL text with named parameters
+            params: Parameter values
+        """
         engine = self._get_engine()
         try:
             from sqlalchemy import text
 
             with engine.connect() as conn:
-                result = conn.execute(text(query), params)
-                columns = result.keys()
-                return [dict(zip(columns, row)) for row in result.fetchall()]
+                return conn.execute(text(query), params).scalars().all()
         except Exception as e:
             raise RuntimeError(f"Query execution failed: {e}")
 
@@ -243,32 +354,20 @@ class OMOPBackend(DataBackend, BatchRuntime):
 
     def _get_datetime_column(self, domain: str) -> str:
         """Get the appropriate datetime column based on domain and config."""
-        if domain == "measurement":
-            return "measurement_datetime" if self.config.use_datetime else "measurement_date"
-        elif domain == "observation":
-            return "observation_datetime" if self.config.use_datetime else "observation_date"
-        elif domain == "condition":
-            return (
-                "condition_start_datetime" if self.config.use_datetime else "condition_start_date"
-            )
-        elif domain == "drug":
-            return (
-                "drug_exposure_start_datetime"
-                if self.config.use_datetime
-                else "drug_exposure_start_date"
-            )
-        elif domain == "procedure":
-            return "procedure_datetime" if self.config.use_datetime else "procedure_date"
-        return "measurement_datetime"
+        columns = DOMAIN_DATETIME_COLUMNS.get(domain)
+        if columns is None:
+            return "measurement_datetime"
+        return columns[0] if self.config.use_datetime else columns[1]
+
+    def _get_match_column(self, domain: str) -> str:
+        """Get the column a signal is matched on (concept_id or source value)."""
+        match_suffix = "source_value" if self.config.use_source_values else "concept_id"
+        return f"{domain.split('_')[0]}_{match_suffix}"
 
     def _get_value_column(self, domain: str) -> str:
         """Get the value column for a domain."""
-        if domain == "measurement":
-            return "value_as_number"
-        elif domain == "observation":
-            return "value_as_number"
         # For other domains, we might check presence (1.0) or absence (0.0)
-        return "1.0"
+        return DOMAIN_VALUE_COLUMNS.get(domain, "1.0")
 
     def resolve_binding(self, signal_ref: str) -> Optional[Binding]:
         """
@@ -330,16 +429,32 @@ class OMOPBackend(DataBackend, BatchRuntime):
         query = "\n".join(query_parts)
         rows = self._execute_query(query, params)
 
-        for row in rows:
-            if row["event_time"] and row["value"] is not None:
+        for patient_id, event_time, value in rows:
+            if event_time and value is not None:
                 yield Event(
-                    patient_id=str(row["patient_id"]),
-                    timestamp=row["event_time"],
+                    patient_id=str(patient_id),
+                    timestamp=event_time,
                     signal_ref="",  # Caller should set this
-                    value=float(row["value"]) if binding.value_type == "numeric" else row["value"],
+                    value=float(value) if binding.value_type == "numeric" else value,
                     unit=binding.unit,
                 )
 
+    def _signal_key(self, signal: Signal) -> Tuple:
+        """
+        Cache key for per-signal lookups (everything the resolution reads).
+
+        OMOPConfig is mutable, so the config-level overrides for the signal are
+        part of the key; editing concept_mappings or source_value_mappings
+        after construction takes effect on the next fetch.
+        """
+        return (
+            signal.name,
+            signal.source,
+            signal.concept_id,
+            self.config.concept_mappings.get(signal.name),
+            self.config.source_value_mappings.get(signal.name),
+        )
+
     def _get_concept_id(self, signal: Signal) -> int:
         """
         Get the concept_id for a signal.
@@ -350,7 +465,18 @@ class OMOPBackend(DataBackend, BatchRuntime):
         3. Config-level concept_mappings override
         4. Signal's concept_id field
         5. Raise error if not found
+
+        The result is cached per signal, so mappings are read once.
         """
+        key = self._signal_key(signal)
+        try:
+            return self._concept_cache[key]
+        except KeyError:
+            concept_id = self._concept_cache[key] = self._resolve_concept_id(signal)
+            return concept_id
+
+    def _resolve_concept_id(self, signal: Signal) -> int:
+        """Look up the concept_id for a signal (uncached, see _get_concept_id)."""
         # Check DatasetSpec first (RFC-0004 recommended approach)
         if self.dataset_spec is not None:
             signal_ref = signal.source or signal.name
@@ -391,7 +517,18 @@ class OMOPBackend(DataBackend, BatchRuntime):
         3. Config-level source_value_mappings override
         4. Signal's source field
         5. Signal's name as fallback
+
+        The result is cached per signal, so mappings are read once.
         """
+        key = self._signal_key(signal)
+        try:
+            return self._source_cache[key]
+        except KeyError:
+            source_value = self._source_cache[key] = self._resolve_source_value(signal)
+            return source_value
+
+    def _resolve_source_value(self, signal: Signal) -> str:
+        """Look up the source_value for a signal (uncached, see _get_source_value)."""
         # Check DatasetSpec first (RFC-0004 recommended approach)
         if self.dataset_spec is not None:
             signal_ref = signal.source or signal.name
@@ -419,6 +556,86 @@ class OMOPBackend(DataBackend, BatchRuntime):
         # Use signal name as fallback
         return signal.name
 
+    def _build_signal_query(
+        self, signal: Signal, batch: bool = False
+    ) -> Tuple["TextClause", Dict[str, Any]]:
+        """
+        Build the time-series query for a signal.
+
+        The SQL only depends on the signal's domain and backend config, so the
+        TextClause is built once per shape and reused across patients.
+
+        Args:
+            signal: Signal definition
+            batch: If True, filter on a list of person_ids (``:person_ids``,
+                expanding) and return person_id as the first column
+
+        Returns:
+            Tuple of (TextClause, params holding the concept/source value).
+            Callers add person filter and window bounds.
+        """
+        domain = signal.domain_str
+        key = (
+            domain,
+            batch,
+            self.config.cdm_schema,
+            self.config.use_datetime,
+            self.config.use_source_values,
+        )
+        statement = self._query_cache.get(key)
+        if statement is None:
+            statement = self._query_cache[key] = self._compile_signal_query(domain, batch)
+
+        # Match on source value or concept_id
+        if self.config.use_source_values:
+            params: Dict[str, Any] = {"match_value": self._get_source_value(signal)}
+        else:
+            params = {"match_value": self._get_concept_id(signal)}
+
+        return statement, params
+
+    def _compile_signal_query(self, domain: str, batch: bool) -> "TextClause":
+        """Render the time-series SQL for a domain as a TextClause."""
+        from sqlalchemy import bindparam, text
+
+        table = self._get_table_name(domain)
+        datetime_col = self._get_datetime_column(domain)
+        value_col = self._get_value_column(domain)
+        has_value = domain in ["measurement", "observation"]
+        match_col = self._get_match_column(domain)
+
+        # Cast in SQL so the driver returns floats (NUMERIC would come back as
+        # Decimal); for conditions/drugs/procedures, we return presence as 1.0
+        value_expr = value_col if has_value else "1.0"
+        select_value = f"CAST({value_expr} AS DOUBLE PRECISION) as value"
+        not_null = f"AND {value_col} IS NOT NULL" if has_value else ""
+
+        if batch:
+            select_person = "person_id,"
+            person_filter = "person_id IN :person_ids"
+            order_by = f"person_id ASC, {datetime_col} ASC"
+        else:
+            select_person = ""
+            person_filter = "person_id = :person_id"
+            order_by = f"{datetime_col} ASC"
+
+        statement = text(f"""
+            SELECT
+                {select_person}
+                {datetime_col} as event_datetime,
+                {select_value}
+            FROM {table}
+            WHERE {person_filter}
+              AND {match_col} = :match_value
+              AND {datetime_col} >= :window_start
+              AND {datetime_col} <= :reference_time
+              {not_null}
+            ORDER BY {order_by}
+        """)
+        if batch:
+            statement = statement.bindparams(bindparam("person_ids", expanding=True))
+        return statement
+
     def fetch_signal_data(
         self,
         patient_id: Any,
@@ -438,96 +655,64 @@ class OMOPBackend(DataBackend, BatchRuntime):
         Returns:
             List of DataPoints sorted by timestamp (ascending)
         """
-        domain = signal.domain.value if signal.domain else "measurement"
-        table = self._get_table_name(domain)
-        datetime_col = self._get_datetime_column(domain)
-        value_col = self._get_value_column(domain)
-
-        window_start = reference_time - timedelta(seconds=window_seconds)
-
-        # Build query based on domain and whether to use source values
-        if self.config.use_source_values:
-            source_value = self._get_source_value(signal)
-            if domain in ["measurement", "observation"]:
-                query = f"""
-                    SELECT
-                        {datetime_col} as event_datetime,
-                        {value_col} as value
-                    FROM {table}
-                    WHERE person_id = :person_id
-                      AND {domain}_source_value = :source_value
-                      AND {datetime_col} >= :window_start
-                      AND {datetime_col} <= :reference_time
-                      AND {value_col} IS NOT NULL
-                    ORDER BY {datetime_col} ASC
-                """
-            else:
-                query = f"""
-                    SELECT
-                        {datetime_col} as event_datetime,
-                        1.0 as value
-                    FROM {table}
-                    WHERE person_id = :person_id
-                      AND {domain.split('_')[0]}_source_value = :source_value
-                      AND {datetime_col} >= :window_start
-                      AND {datetime_col} <= :reference_time
-                    ORDER BY {datetime_col} ASC
-                """
-            params = {
+        statement, params = self._build_signal_query(signal)
+        params.update(
+            {
                 "person_id": patient_id,
-                "source_value": source_value,
-                "window_start": window_start,
+                "window_start": reference_time - window_delta(window_seconds),
                 "reference_time": reference_time,
             }
-        else:
-            concept_id = self._get_concept_id(signal)
-            if domain in ["measurement", "observation"]:
-                query = f"""
-                    SELECT
-                        {datetime_col} as event_datetime,
-                        {value_col} as value
-                    FROM {table}
-                    WHERE person_id = :person_id
-                      AND {domain}_concept_id = :concept_id
-                      AND {datetime_col} >= :window_start
-                      AND {datetime_col} <= :reference_time
-                      AND {value_col} IS NOT NULL
-                    ORDER BY {datetime_col} ASC
-                """
-            else:
-                # For conditions/drugs/procedures, we return presence as 1.0
-                query = f"""
-                    SELECT
-                        {datetime_col} as event_datetime,
-                        1.0 as value
-                    FROM {table}
-                    WHERE person_id = :person_id
-                      AND {domain.split('_')[0]}_concept_id = :concept_id
-                      AND {datetime_col} >= :window_start
-                      AND {datetime_col} <= :reference_time
-                    ORDER BY {datetime_col} ASC
-                """
-            params = {
-                "person_id": patient_id,
-                "concept_id": concept_id,
-                "window_start": window_start,
+        )
+
+        rows = self._execute_query(statement, params, stream=False)
+
+        # Rows are already filtered (window bounds exclude NULL times, values
+        # are NOT NULL or a 1.0 presence marker) and cast to float in SQL
+        return [DataPoint(timestamp=event_datetime, value=value) for event_datetime, value in rows]
+
+    def fetch_signal_data_batch(
+        self,
+        patient_ids: List[Any],
+        signal: Signal,
+        window_seconds: int,
+        reference_time: datetime,
+    ) -> Dict[Any, List[DataPoint]]:
+        """
+        Fetch time-series data for a signal for many patients in one query.
+
+        Args:
+            patient_ids: OMOP person_ids
+            signal: Signal definition with concept_id
+            window_seconds: How far back to fetch
+            reference_time: End of the time window
+
+        Returns:
+            Dict mapping every requested person_id (as passed in, so "1" and 1
+            both work) to its DataPoints sorted by timestamp (ascending)
+        """
+        if not patient_ids:
+            return {}
+
+        statement, params = self._build_signal_query(signal, batch=True)
+        params.update(
+            {
+                "person_ids": list(dict.fromkeys(patient_ids)),
+                "window_start": reference_time - window_delta(window_seconds),
                 "reference_time": reference_time,
             }
+        )
 
-        rows = self._execute_query(query, params)
+        rows = self._execute_query(statement, params)
 
-        # Convert to DataPoints
-        data_points = []
-        for row in rows:
-            if row["event_datetime"] and row["value"] is not None:
-                data_points.append(
-                    DataPoint(
-                        timestamp=row["event_datetime"],
-                        value=float(row["value"]),
-                    )
-                )
+        # The driver returns person_id in the column's type; match rows back to
+        # the requested IDs by string so callers passing "1" still get data
+        by_person: Dict[str, List[DataPoint]] = {}
+        for person_id, event_datetime, value in rows:
+            by_person.setdefault(str(person_id), []).append(
+                DataPoint(timestamp=event_datetime, value=value)
+            )
 
-        return data_points
+        return {pid: list(by_person.get(str(pid), ())) for pid in patient_ids}
 
     def _parse_population_criterion(
         self, criterion: str, params: Dict[str, Any], param_idx: int
@@ -700,8 +885,7 @@ class OMOPBackend(DataBackend, BatchRuntime):
 
         query += " ORDER BY p.person_id"
 
-        rows = self._execute_query(query, params)
-        return [row["person_id"] for row in rows]
+        return self._execute_scalars(query, params)
 
     def get_patient_ids_with_signal(
         self,
@@ -720,13 +904,13 @@ class OMOPBackend(DataBackend, BatchRuntime):
         Returns:
             List of person_ids with sufficient data
         """
-        domain = signal.domain.value if signal.domain else "measurement"
+        domain = signal.domain_str
         table = self._get_table_name(domain)
 
         if self.config.use_source_values:
             source_value = self._get_source_value(signal)
             query = f"""
-                SELECT person_id, COUNT(*) as obs_count
+                SELECT person_id
                 FROM {table}
                 WHERE {domain}_source_value = :source_value
                 GROUP BY person_id
@@ -737,7 +921,7 @@ class OMOPBackend(DataBackend, BatchRuntime):
         else:
             concept_id = self._get_concept_id(signal)
             query = f"""
-                SELECT person_id, COUNT(*) as obs_count
+                SELECT person_id
                 FROM {table}
                 WHERE {domain}_concept_id = :concept_id
                 GROUP BY person_id
@@ -746,8 +930,70 @@ class OMOPBackend(DataBackend, BatchRuntime):
             """
             params = {"concept_id": concept_id, "min_obs": min_observations}
 
-        rows = self._execute_query(query, params)
-        return [row["person_id"] for row in rows]
+        return self._execute_scalars(query, params)
+
+    def _signal_index_columns(self, domain: str) -> Tuple[str, str, str]:
+        """Columns the signal query filters on: (person, match, event time)."""
+        return (
+            "person_id",
+            self._get_match_column(domain),
+            self._get_datetime_column(domain),
+        )
+
+    def index_ddl(self, domain: str = "measurement") -> str:
+        """
+        CREATE INDEX statement that serves fetch_signal_data for a domain.
+
+        The equality columns (person, concept/source value) lead and the event
+        time comes last, so the window filter is a range scan that already
+        returns rows in ORDER BY order.
+
+        Args:
+            domain: PSDL domain name (measurement, observation, ...)
+
+        Returns:
+            Portable DDL string (see docs for a PostgreSQL covering variant)
+        """
+        columns = ", ".join(self._signal_index_columns(domain))
+        qualified = self._get_table_name(domain)
+        table = qualified.rpartition(".")[2]
+        return f"CREATE INDEX idx_psdl_{table} ON {qualified} ({columns})"
+
+    def check_indexes(self, domains: Optional[List[str]] = None) -> List[str]:
+        """
+        Check that signal tables have an index matching the signal query.
+
+        An index matches when its first two columns are person_id and the
+        concept (or source value) column in either order, followed by the
+        event time column. A warning is emitted for each table without one.
+
+        Args:
+            domains: PSDL domains to check (default: measurement)
+
+        Returns:
+            index_ddl() statements for the tables missing an index
+        """
+        from sqlalchemy import inspect
+
+        inspector = inspect(self._get_engine())
+        missing = []
+        for domain in domains or ["measurement"]:
+            person_col, match_col, time_col = self._signal_index_columns(domain)
+            schema, _, table = self._get_table_name(domain).rpartition(".")
+            indexes = inspector.get_indexes(table, schema=schema)
+            if not any(
+                set(index["column_names"][:2]) == {person_col, match_col}
+                and index["column_names"][2:3] == [time_col]
+                for index in indexes
+            ):
+                ddl = self.index_ddl(domain)
+                warnings.warn(
+                    f"No index on {table} covers the PSDL signal query; "
+                    f"each fetch will scan the table. Suggested: {ddl}",
+                    stacklevel=2,
+                )
+                missing.append(ddl)
+        return missing
 
     def close(self):
         """Close database connection."""
@@ -772,6 +1018,8 @@ class OMOPBackend(DataBackend, BatchRuntime):
         ds = dataset_spec or self.dataset_spec
         compiler = CohortCompiler(
             schema=self.config.cdm_schema,
+            use_source_values=self.config.use_source_values,
+            source_value_mappings=self.config.source_value_mappings,
             dialect="postgresql",
             dataset_spec=ds,
         )
@@ -782,13 +1030,15 @@ class OMOPBackend(DataBackend, BatchRuntime):
         scenario: Any,
         dataset_spec: Any = None,
         patient_ids: Optional[List[str]] = None,
+        reference_time: Optional[datetime] = None,
     ) -> Iterator[BatchResult]:
         """Compile and execute a scenario, yielding results per patient.
 
         Args:
             scenario: Parsed PSDL scenario
             dataset_spec: Optional DatasetSpec override
-            patient_ids: Optional patient ID filter
+            patient_ids: Optional patient ID filter (applied in SQL)
+            reference_time: Point in time for evaluation (default: database NOW())
 
         Yields:
             BatchResult for each patient
@@ -796,15 +1046,25 @@ class OMOPBackend(DataBackend, BatchRuntime):
         compiled = self.compile(scenario, dataset_spec)
         engine = self._get_engine()
 
-        from sqlalchemy import text
+        from sqlalchemy import bindparam, text
 
+        sql = compiled.sql
         params = dict(compiled.parameters)
+        if reference_time is not None:
+            params["reference_time"] = reference_time
+
+        statement = text(sql)
+        if patient_ids is not None:
+            statement = text(
+                f"SELECT * FROM (\n{sql}\n) AS cohort WHERE person_id IN :patient_ids"
+            ).bindparams(bindparam("patient_ids", expanding=True))
+            params["patient_ids"] = list(patient_ids)
+
         with engine.connect() as conn:
-            result = conn.execute(text(compiled.sql), params)
-            columns = list(result.keys())
+            result = conn.execute(statement, params)
 
             for row in result:
-                row_dict = dict(zip(columns, row))
+                row_dict = row._mapping
                 pid = str(row_dict.get("person_id", row[0]))
 
                 # Extract logic columns
@@ -832,6 +1092,40 @@ class OMOPBackend(DataBackend, BatchRuntime):
                     logic_results=logic_results,
                 )
 
+    def screen_cohort(
+        self,
+        scenario: Any,
+        reference_time: Optional[datetime] = None,
+        patient_ids: Optional[List[Any]] = None,
+        dataset_spec: Any = None,
+    ) -> List[str]:
+        """
+        Find triggered patients with a single in-database query.
+
+        Trends and logic are computed by the compiled cohort SQL, so only the
+        triggered person_ids cross the wire. Useful as a cheap pre-filter
+        before detailed evaluation with SinglePatientEvaluator.
+
+        Args:
+            scenario: Parsed PSDL scenario
+            reference_time: Point in time for evaluation (default: database NOW())
+            patient_ids: Optional patient ID filter
+            dataset_spec: Optional DatasetSpec override
+
+        Returns:
+            person_ids (as strings) for which any logic expression triggered
+        """
+        return [
+            result.patient_id
+            for result in self.execute(
+                scenario,
+                dataset_spec=dataset_spec,
+                patient_ids=patient_ids,
+                reference_time=reference_time,
+            )
+            if result.triggered
+        ]
+
 
 # Convenience function for quick setup
 def create_omop_backend(
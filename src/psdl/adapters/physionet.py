@@ -11,12 +11,14 @@ Usage:
     backend.load_patient("p000001")
 """
 
+import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ..core.ir import Signal
-from ..operators import DataPoint, TemporalOperators
+from ..operators import DataPoint, DataSeries, TemporalOperators
 from ..runtimes.single import DataBackend
 
 # PhysioNet column mappings to standardized signal names
@@ -73,6 +75,18 @@ PHYSIONET_SIGNALS = {
 REVERSE_SIGNALS = {v: k for k, v in PHYSIONET_SIGNALS.items()}
 
 
+@lru_cache(maxsize=None)
+def _normalize_patient_id(patient_id: str) -> str:
+    """Normalize a patient ID to the file stem format ("000001" -> "p000001").
+
+    Results are cached and interned, since the same few IDs are looked up for
+    every signal fetch and key the per-patient dicts.
+    """
+    if not patient_id.startswith("p"):
+        patient_id = f"p{patient_id.zfill(6)}"
+    return sys.intern(patient_id)
+
+
 class PhysioNetBackend(DataBackend):
     """
     Data backend for PhysioNet Challenge 2019 sepsis data.
@@ -94,7 +108,8 @@ class PhysioNetBackend(DataBackend):
         """
         self.data_path = Path(data_path)
         self.base_datetime = base_datetime or datetime(2024, 1, 1, 0, 0, 0)
-        self._patient_data: Dict[str, Dict[str, List[DataPoint]]] = {}
+        # Each signal is stored column-wise (see DataSeries), not as DataPoints
+        self._patient_data: Dict[str, Dict[str, DataSeries]] = {}
         self._patient_metadata: Dict[str, Dict] = {}
         self._current_patient: Optional[str] = None
 
@@ -113,9 +128,7 @@ class PhysioNetBackend(DataBackend):
         Returns:
             True if loaded successfully, False otherwise
         """
-        # Normalize patient ID format
-        if not patient_id.startswith("p"):
-            patient_id = f"p{patient_id.zfill(6)}"
+        patient_id = _normalize_patient_id(patient_id)
 
         psv_file = self.data_path / f"{patient_id}.psv"
         if not psv_file.exists():
@@ -124,71 +137,84 @@ class PhysioNetBackend(DataBackend):
         self._patient_data[patient_id] = {}
         self._patient_metadata[patient_id] = {}
 
-        with open(psv_file, "r") as f:
-            lines = f.readlines()
-
-        if not lines:
-            return False
-
-        # Parse header
-        header = lines[0].strip().split("|")
-        col_indices = {col: i for i, col in enumerate(header)}
-
-        # Parse data rows
-        sepsis_onset_hour: Optional[int] = None
-        for line in lines[1:]:
-            parts = line.strip().split("|")
-            if len(parts) != len(header):
-                continue
-
-            # Get ICULOS (hour index)
+        # Binary mode: rows are streamed without decoding, and float() parses
+        # the bytes cells directly
+        with open(psv_file, "rb") as f:
+            header_line = f.readline()
+            if not header_line:
+                return False
+
+            # Parse header
+            header = header_line.decode("utf-8").strip().split("|")
+            col_indices = {col: i for i, col in enumerate(header)}
+
+            # Mapped signal columns present in this file, resolved once rather
+            # than looked up (and mostly skipped) on every row
+            signal_columns = [
+                (col_indices[col_name], signal_name)
+                for col_name, signal_name in PHYSIONET_SIGNALS.items()
+                if col_name in col_indices
+            ]
+
+            # Per-row invariants, looked up once
             iculos_idx = col_indices.get("ICULOS")
-            if iculos_idx is None:
-                continue
-            try:
-                hour = int(float(parts[iculos_idx]))
-            except (ValueError, IndexError):
-                continue
-
-            timestamp = self.base_datetime + timedelta(hours=hour)
-
-            # Check for sepsis label
             sepsis_idx = col_indices.get("SepsisLabel")
-            if sepsis_idx is not None:
-                try:
-                    sepsis_label = int(float(parts[sepsis_idx]))
-                    if sepsis_label == 1 and sepsis_onset_hour is None:
-                        sepsis_onset_hour = hour
-                except (ValueError, IndexError):
-                    pass
-
-            # Parse each signal
-            for col_name, signal_name in PHYSIONET_SIGNALS.items():
-                idx = col_indices.get(col_name)
-                if idx is None:
-                    continue
-
-                value_str = parts[idx].strip()
-                if value_str == "NaN" or value_str == "":
+            n_cols = len(header)
+            base_datetime = self.base_datetime
+
+            # Parse data rows into per-signal timestamp and value columns; rows
+            # are only timed by ICULOS (hour index), so without it none are used
+            columns: Dict[str, Tuple[List[datetime], List[float]]] = {}
+            sepsis_onset_hour: Optional[int] = None
+            last_hour = 0
+            for line in f if iculos_idx is not None else ():
+                parts = line.strip().split(b"|")
+                if len(parts) != n_cols:
                     continue
 
                 try:
-                    value = float(value_str)
+                    hour = int(float(parts[iculos_idx]))
                 except ValueError:
                     continue
 
-                if signal_name not in self._patient_data[patient_id]:
-                    self._patient_data[patient_id][signal_name] = []
-
-                self._patient_data[patient_id][signal_name].append(
-                    DataPoint(timestamp=timestamp, value=value)
-                )
+                last_hour = hour
+                timestamp = base_datetime + timedelta(hours=hour)
+
+                # Check for sepsis label
+                if sepsis_idx is not None and sepsis_onset_hour is None:
+                    try:
+                        if int(float(parts[sepsis_idx])) == 1:
+                            sepsis_onset_hour = hour
+                    except ValueError:
+                        pass
+
+                # Parse each signal
+                for idx, signal_name in signal_columns:
+                    value_bytes = parts[idx].strip()
+                    if value_bytes == b"NaN" or value_bytes == b"":
+                        continue
+
+                    try:
+                        value = float(value_bytes)
+                    except ValueError:
+                        continue
+
+                    column = columns.get(signal_name)
+                    if column is None:
+                        column = columns[signal_name] = ([], [])
+                    column[0].append(timestamp)
+                    column[1].append(value)
+
+        self._patient_data[patient_id] = {
+            signal_name: DataSeries(timestamps, values)
+            for signal_name, (timestamps, values) in columns.items()
+        }
 
         # Store metadata
         self._patient_metadata[patient_id] = {
             "sepsis_onset_hour": sepsis_onset_hour,
             "has_sepsis": sepsis_onset_hour is not None,
-            "total_hours": hour if "hour" in dir() else 0,
+            "total_hours": last_hour,
         }
 
         self._current_patient = patient_id
@@ -222,9 +248,9 @@ class PhysioNetBackend(DataBackend):
         data = self._patient_data.get(pid, {}).get(signal_name, [])
 
         if reference_time is not None:
-            data = [dp for dp in data if dp.timestamp <= reference_time]
+            return [dp for dp in data if dp.timestamp <= reference_time]
 
-        return data
+        return list(data)
 
     def get_patient_metadata(self, patient_id: Optional[str] = None) -> Dict:
         """Get metadata for a patient."""
@@ -270,10 +296,10 @@ class PhysioNetBackend(DataBackend):
             reference_time: End of the time window
 
         Returns:
-            List of DataPoints sorted by timestamp (ascending)
+            DataPoints sorted by timestamp (ascending)
         """
         # Ensure patient is loaded
-        pid = str(patient_id)
+        pid = _normalize_patient_id(str(patient_id))
         if pid not in self._patient_data:
             self.load_patient(pid)
 
@@ -287,8 +313,8 @@ class PhysioNetBackend(DataBackend):
         # Get all data for this signal
         data = self._patient_data.get(pid, {}).get(signal_name, [])
 
-        # Filter by window
-        return TemporalOperators.filter_by_window(data, window_seconds, reference_time)
+        # Filter by window (a DataSeries slice), returned as a list
+        return list(TemporalOperators.filter_by_window(data, window_seconds, reference_time))
 
     def get_patient_ids(
         self,
@@ -184,13 +184,14 @@ class BenchmarkRunner:
 
         # Set reference time
         if reference_time is None:
-            # Use latest timestamp from data
-            all_timestamps = []
+            # Use latest timestamp from data (tracked in one pass, no list)
+            latest = None
             for patient_data in data.values():
                 for signal_data in patient_data.values():
                     for dp in signal_data:
-                        all_timestamps.append(dp.timestamp)
-            reference_time = max(all_timestamps) if all_timestamps else datetime.now()
+                        if latest is None or dp.timestamp > latest:
+                            latest = dp.timestamp
+            reference_time = latest if latest is not None else datetime.now()
 
         # Warmup runs
         for _ in range(self.warmup_iterations):
@@ -155,6 +155,11 @@ class Signal:
         """v0.2 compatibility: 'source' is now 'ref'."""
         return self.ref
 
+    @property
+    def domain_str(self) -> str:
+        """Domain name used for backend table lookups (defaults to measurement)."""
+        return self.domain.value if self.domain else "measurement"
+
 
 # WindowSpec is imported from psdl._generated.ast_types
 
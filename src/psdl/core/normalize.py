@@ -22,7 +22,7 @@ Usage:
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import IO, Any, Dict, Union
 
 import yaml
 
@@ -33,7 +33,12 @@ class PSDLYAMLError(Exception):
     pass
 
 
-class PSDLSafeLoader(yaml.SafeLoader):
+# libyaml's C parser when PyYAML was built with it (3-10x faster), otherwise
+# the pure-Python parser; both share SafeConstructor, so results are identical
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class PSDLSafeLoader(_BaseSafeLoader):  # type: ignore[misc,valid-type]
     """
     Custom YAML loader that enforces deterministic type handling.
 
@@ -84,12 +89,13 @@ VERSION_PATTERN_FIELDS = {
 }
 
 
-def normalize_yaml(content: str) -> Dict[str, Any]:
+def normalize_yaml(content: Union[str, bytes, IO]) -> Dict[str, Any]:
     """
     Parse YAML with deterministic type handling.
 
     Args:
-        content: YAML string content
+        content: YAML string content, or an open file (text or binary), which
+            the loader reads incrementally
 
     Returns:
         Normalized dictionary with deterministic types
@@ -131,8 +137,8 @@ def load_yaml_normalized(path: Union[str, Path]) -> Dict[str, Any]:
     if not path.exists():
         raise PSDLYAMLError(f"File not found: {path}")
 
-    content = path.read_text(encoding="utf-8")
-    return normalize_yaml(content)
+    with path.open("rb") as f:
+        return normalize_yaml(f)
 
 
 def _normalize_types(obj: Any, path: str = "") -> Any:
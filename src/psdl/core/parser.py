@@ -14,6 +14,7 @@ Version 0.3.0 (RFC-0005) - STRICT MODE:
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from psdl.expression_parser import (
@@ -55,6 +56,20 @@ class PSDLParseError(Exception):
         super().__init__(f"PSDL Parse Error{f' (line {line})' if line else ''}: {message}")
 
 
+@lru_cache(maxsize=256)
+def _parse_window_parts(window_str: str) -> Optional[Tuple[int, str]]:
+    """
+    (value, unit) of a window string, or None if invalid.
+
+    Memoized: scenarios reuse a handful of windows. WindowSpec is mutable,
+    so callers build a fresh one from the cached parts.
+    """
+    match = PSDLParser.WINDOW_PATTERN.match(window_str)
+    if not match:
+        return None
+    return int(match.group(1)), match.group(2)
+
+
 class PSDLParser:
     """
     Parser for PSDL scenario definitions.
@@ -74,6 +89,9 @@ class PSDLParser:
     )
     LOGIC_TERM_PATTERN = re.compile(r"\b(\w+)\b")
     LOGIC_OPERATOR_PATTERN = re.compile(r"\b(AND|OR|NOT)\b", re.IGNORECASE)
+    # Operators and terms in one scan: a word is an operator if it is exactly
+    # AND/OR/NOT, otherwise it backtracks to the term alternative
+    LOGIC_TOKEN_PATTERN = re.compile(r"\b(?:(?P<op>AND|OR|NOT)|(?P<term>\w+))\b", re.IGNORECASE)
 
     def __init__(self):
         self.errors: List[str] = []
@@ -86,9 +104,26 @@ class PSDLParser:
             filepath: path to the YAML file
             strict: when True, validate against spec/schema.json before parsing.
         """
-        with open(filepath, "r") as f:
-            content = f.read()
-        return self.parse_string(content, source=filepath, strict=strict)
+        if strict:
+            # Schema validation works on the document text
+            with open(filepath, "r") as f:
+                content = f.read()
+            return self.parse_string(content, source=filepath, strict=strict)
+
+        self.errors = []
+        self.warnings = []
+
+        from psdl.core.normalize import PSDLYAMLError, normalize_yaml
+
+        # Hand the open file to the YAML loader, which reads it incrementally,
+        # instead of holding the whole text in memory alongside the parsed data
+        try:
+            with open(filepath, "rb") as f:
+                data = normalize_yaml(f)
+        except PSDLYAMLError as e:
+            raise PSDLParseError(str(e))
+
+        return self._parse_data(data)
 
     def parse_string(
         self, content: str, source: str = "<string>", strict: bool = False
@@ -123,6 +158,10 @@ class PSDLParser:
         except PSDLYAMLError as e:
             raise PSDLParseError(str(e))
 
+        return self._parse_data(data)
+
+    def _parse_data(self, data: Any) -> PSDLScenario:
+        """Build and validate a scenario from the loaded YAML document."""
         if not isinstance(data, dict):
             raise PSDLParseError("PSDL document must be a YAML mapping")
 
@@ -421,10 +460,10 @@ class PSDLParser:
 
     def _parse_window(self, window_str: str) -> WindowSpec:
         """Parse a window specification like '6h' or '30m'."""
-        match = self.WINDOW_PATTERN.match(window_str)
-        if not match:
+        parts = _parse_window_parts(window_str)
+        if parts is None:
             raise PSDLParseError(f"Invalid window specification: '{window_str}'")
-        return WindowSpec(value=int(match.group(1)), unit=match.group(2))
+        return WindowSpec(value=parts[0], unit=parts[1])
 
     def _parse_trend_expr(self, name: str, expr: str) -> TrendExpr:
         """
@@ -498,25 +537,23 @@ class PSDLParser:
 
     def _parse_logic_expr(self, name: str, expr: str) -> Tuple[List[str], List[str]]:
         """Extract terms and operators from a logic expression."""
-        # Find all operators
-        operators = self.LOGIC_OPERATOR_PATTERN.findall(expr)
-        operators = [op.upper() for op in operators]
-
-        # Find all terms (excluding operators)
-        expr_without_ops = self.LOGIC_OPERATOR_PATTERN.sub(" ", expr)
-        all_terms = self.LOGIC_TERM_PATTERN.findall(expr_without_ops)
-
-        # v0.3: Filter out numeric values and comparison operators
-        # Numbers can appear in comparisons like "cr_delta_48h >= 0.3"
-        terms = [
-            t
-            for t in all_terms
-            if not t.replace("_", "").isdigit()  # Filter pure numbers
-            and not t.startswith(
-                ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
-            )  # Filter numeric literals
-            and t not in ("true", "false", "True", "False")  # Filter boolean literals
-        ]
+        terms: List[str] = []
+        operators: List[str] = []
+        for match in self.LOGIC_TOKEN_PATTERN.finditer(expr):
+            op = match.group("op")
+            if op is not None:
+                operators.append(op.upper())
+                continue
+
+            # v0.3: Filter out numeric values and comparison operators
+            # Numbers can appear in comparisons like "cr_delta_48h >= 0.3"
+            term = match.group("term")
+            if (
+                not term.replace("_", "").isdigit()  # Filter pure numbers
+                and term[0] not in "0123456789"  # Filter numeric literals
+                and term not in ("true", "false", "True", "False")  # Filter boolean literals
+            ):
+                terms.append(term)
 
         return terms, operators
 
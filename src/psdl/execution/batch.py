@@ -42,6 +42,7 @@ from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
@@ -152,7 +153,7 @@ class InMemoryBackend(DataBackend):
         """Add signal data for a patient."""
         if patient_id not in self.data:
             self.data[patient_id] = {}
-        self.data[patient_id][signal_name] = sorted(data, key=lambda dp: dp.timestamp)
+        self.data[patient_id][signal_name] = sorted(data, key=attrgetter("timestamp"))
         self.patients.add(patient_id)
 
     def add_patient(self, patient_id: Any, **attributes):
@@ -28,6 +28,7 @@ Usage (legacy):
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
@@ -73,8 +74,9 @@ class CompiledSQL:
     logic_columns: List[str]
 
 
+@lru_cache(maxsize=256)
 def parse_window(window_str: str) -> int:
-    """Parse window string like '48h' into seconds."""
+    """Parse window string like '48h' into seconds (memoized per string)."""
     match = re.match(r"(\d+)([smhdw])", window_str)
     if not match:
         raise ValueError(f"Invalid window format: {window_str}")
@@ -14,6 +14,7 @@ These classes are designed for PyFlink but can be tested in isolation.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from .models import ClinicalEvent, TrendResult
@@ -125,7 +126,7 @@ class DeltaWindowFunction(WindowFunction):
         if len(events) < 2:
             return 0.0
 
-        sorted_events = sorted(events, key=lambda e: e.timestamp)
+        sorted_events = sorted(events, key=attrgetter("timestamp"))
         first_value = sorted_events[0].value
         last_value = sorted_events[-1].value
 
@@ -149,7 +150,7 @@ class SlopeWindowFunction(WindowFunction):
         if len(events) < 2:
             return 0.0
 
-        sorted_events = sorted(events, key=lambda e: e.timestamp)
+        sorted_events = sorted(events, key=attrgetter("timestamp"))
 
         # Convert timestamps to minutes from first event
         base_time = sorted_events[0].timestamp
@@ -20,26 +20,513 @@ Null Handling (per PSDL spec):
 """
 
 import math
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import mul
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+@lru_cache(maxsize=None)
+def window_delta(window_seconds: int) -> timedelta:
+    """
+    timedelta for a window size, memoized.
+
+    Scenarios use a handful of distinct window sizes, so every operator call
+    and backend fetch reuses the same timedelta instead of allocating one.
+    """
+    return timedelta(seconds=window_seconds)
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+_MICROSECOND = timedelta(microseconds=1)
+
+# Fixed-point scale for exact running sums: every float is an integer
+# multiple of 2**-1074, so scaled values add and subtract without rounding
+_FIXED_BITS = 1074
+_FIXED_ONE = 1 << _FIXED_BITS
+
+
+def _to_fixed(value: float) -> int:
+    """Exact fixed-point integer for a finite float (see _FIXED_BITS)."""
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_FIXED_BITS + 1 - denominator.bit_length())
+
+
+def epoch_micros(timestamps: Sequence[datetime]) -> List[int]:
+    """
+    Timestamps as integer microseconds since the Unix epoch.
+
+    Integers keep full timestamp precision: differences between them are
+    exact, and dividing one by 10**6 gives the same float as
+    timedelta.total_seconds(). Naive timestamps are measured from a naive
+    epoch (no local-time conversion); a series is assumed to be all naive or
+    all aware.
+    """
+    if not timestamps:
+        return []
+    epoch = _EPOCH if timestamps[0].tzinfo is None else _EPOCH_UTC
+    return [(ts - epoch) // _MICROSECOND for ts in timestamps]
 
 
 @dataclass
 class DataPoint:
     """A single time-series data point with optional null value."""
 
+    # Declared by hand (dataclass slots=True needs Python 3.10): no per-instance
+    # __dict__ for the many DataPoints a cohort fetch allocates
+    __slots__ = ("timestamp", "value")
+
     timestamp: datetime
     value: Optional[float]  # Can be None per PSDL spec
 
 
+class DataSeries:
+    """
+    Column-oriented time-series: parallel timestamp and value lists.
+
+    Stores one signal as two lists instead of one DataPoint object per
+    observation. It behaves like a read-only List[DataPoint] (len, iteration,
+    indexing, slicing), so every operator accepts it, and window filtering
+    runs over the columns directly. The evaluator converts each fetched
+    signal once and shares the series across all trends.
+    """
+
+    __slots__ = ("timestamps", "values", "_micros", "_windows")
+
+    # Window results remembered per series (see _window_bounds); a series is
+    # built per evaluation tick, so this only needs to hold a tick's windows
+    WINDOW_CACHE_SIZE = 16
+
+    def __init__(
+        self,
+        timestamps: List[datetime],
+        values: List[Optional[float]],
+        micros: Optional[List[int]] = None,
+    ):
+        self.timestamps = timestamps
+        self.values = values
+        self._micros = micros
+        self._windows: Optional[dict] = None
+
+    @property
+    def micros(self) -> List[int]:
+        """
+        Timestamps as epoch microseconds (see epoch_micros), computed on first use.
+
+        Slices of a series share the parent's column when it has already been
+        computed, so datetime arithmetic is paid once per series rather than
+        once per operator call.
+        """
+        if self._micros is None:
+            self._micros = epoch_micros(self.timestamps)
+        return self._micros
+
+    def ensure_micros(self) -> None:
+        """Compute the micros column now, so that slices taken later share it."""
+        if self._micros is None:
+            self._micros = epoch_micros(self.timestamps)
+
+    @classmethod
+    def from_points(cls, data: Sequence[DataPoint]) -> "DataSeries":
+        """Build a series from DataPoints (returned unchanged if already a series)."""
+        if isinstance(data, DataSeries):
+            return data
+        return cls([dp.timestamp for dp in data], [dp.value for dp in data])
+
+    def to_points(self) -> List[DataPoint]:
+        """Materialize as a list of DataPoints."""
+        return [DataPoint(ts, v) for ts, v in zip(self.timestamps, self.values)]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[DataPoint]:
+        return map(DataPoint, self.timestamps, self.values)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[DataPoint, "DataSeries"]:
+        if isinstance(index, slice):
+            micros = None if self._micros is None else self._micros[index]
+            return DataSeries(self.timestamps[index], self.values[index], micros)
+        return DataPoint(self.timestamps[index], self.values[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DataSeries):
+            return self.timestamps == other.timestamps and self.values == other.values
+        if isinstance(other, list):
+            return self.to_points() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"DataSeries(n={len(self)})"
+
+
+# Either representation is accepted by the operators below
+SeriesLike = Union[List[DataPoint], DataSeries]
+
+
+def _columns(data: SeriesLike) -> Tuple[List[datetime], List[Optional[float]]]:
+    """Timestamps and values of a series as two parallel lists."""
+    if isinstance(data, DataSeries):
+        return data.timestamps, data.values
+    return [dp.timestamp for dp in data], [dp.value for dp in data]
+
+
+def _lower_bound(data: Sequence[DataPoint], ts: datetime, strict: bool) -> int:
+    """First index whose timestamp is >= ts (> ts when strict); data sorted."""
+    lo, hi = 0, len(data)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        mid_ts = data[mid].timestamp
+        if mid_ts < ts or (strict and mid_ts == ts):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _window_bounds(
+    data: SeriesLike,
+    window_seconds: int,
+    reference_time: Optional[datetime] = None,
+) -> Tuple[int, int]:
+    """
+    Index range [lo, hi) of the points within the window.
+
+    Data is sorted by timestamp, so both ends are found by binary search
+    (bisect on a DataSeries' timestamp column) in O(log n) instead of testing
+    every point; data[lo:hi] is exactly filter_by_window's result.
+    """
+    ref_time = reference_time or datetime.now()
+    window_start = ref_time - window_delta(window_seconds)
+
+    # The window usually ends at or after the newest point (evaluating "now",
+    # or at the latest observation), so the upper search is rarely needed
+    if isinstance(data, DataSeries):
+        timestamps = data.timestamps
+        if timestamps and timestamps[-1] <= ref_time:
+            hi = len(timestamps)
+        else:
+            hi = bisect_right(timestamps, ref_time)
+        return bisect_left(timestamps, window_start, 0, hi), hi
+
+    if data and data[-1].timestamp <= ref_time:
+        hi = len(data)
+    else:
+        hi = _lower_bound(data, ref_time, True)
+    return _lower_bound(data, window_start, False), hi
+
+
+def _series_window_cache(
+    data: DataSeries, reference_time: Optional[datetime]
+) -> Optional[Dict[Tuple[Any, ...], Any]]:
+    """
+    Per-series memo for window results, or None when results can't be reused.
+
+    Trends that share a (signal, window) at the same reference time would
+    otherwise each re-select the same window. Without an explicit reference
+    time the window end is datetime.now(), which never repeats, so nothing
+    is cached. The memo is dropped when it outgrows WINDOW_CACHE_SIZE.
+    """
+    if reference_time is None:
+        return None
+    cache = data._windows
+    if cache is None or len(cache) >= DataSeries.WINDOW_CACHE_SIZE:
+        cache = data._windows = {}
+    return cache
+
+
+def _window_values(
+    data: SeriesLike,
+    window_seconds: int,
+    reference_time: Optional[datetime] = None,
+) -> List[float]:
+    """
+    Non-null values within the window, in timestamp order.
+
+    Equivalent to filter_non_null(filter_by_window(...)) but without
+    building intermediate DataPoint lists; value-only operators compute
+    directly on the returned floats. For a DataSeries the list is shared
+    between operators on the same window and must not be modified.
+    """
+    if not data:
+        return []
+
+    if not isinstance(data, DataSeries):
+        lo, hi = _window_bounds(data, window_seconds, reference_time)
+        return [dp.value for dp in data[lo:hi] if dp.value is not None]
+
+    cache = _series_window_cache(data, reference_time)
+    key = (window_seconds, reference_time)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    lo, hi = _window_bounds(data, window_seconds, reference_time)
+    values = [v for v in data.values[lo:hi] if v is not None]
+    if cache is not None:
+        cache[key] = values
+    return values
+
+
+def _sorted_window_values(
+    data: SeriesLike,
+    values: List[float],
+    window_seconds: int,
+    reference_time: Optional[datetime] = None,
+) -> List[float]:
+    """
+    The window's non-null values in ascending order.
+
+    values is the window's _window_values result. For a DataSeries the sorted
+    copy is kept alongside it, so several percentiles over the same window
+    sort once.
+    """
+    if not isinstance(data, DataSeries):
+        return sorted(values)
+
+    cache = _series_window_cache(data, reference_time)
+    key = ("sorted", window_seconds, reference_time)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    ordered = sorted(values)
+    if cache is not None:
+        cache[key] = ordered
+    return ordered
+
+
+def _window_xy(
+    data: SeriesLike,
+    window_seconds: int,
+    reference_time: Optional[datetime] = None,
+) -> Tuple[List[int], List[float]]:
+    """
+    Epoch microseconds and values of the non-null points within the window.
+
+    Column counterpart of _window_values for operators that also need time
+    (slope). A DataSeries supplies its cached micros column; a DataPoint
+    list converts only the window.
+    """
+    if not data:
+        return [], []
+
+    lo, hi = _window_bounds(data, window_seconds, reference_time)
+    if not isinstance(data, DataSeries):
+        window = [dp for dp in data[lo:hi] if dp.value is not None]
+        return epoch_micros([dp.timestamp for dp in window]), [dp.value for dp in window]
+
+    x: List[int] = []
+    y: List[float] = []
+    for us, v in zip(data.micros[lo:hi], data.values[lo:hi]):
+        if v is not None:
+            x.append(us)
+            y.append(v)
+    return x, y
+
+
+# Numeric kernels: plain float lists in, float out. Operators do the window
+# selection and null handling; these hold the arithmetic loops, written to
+# keep per-element work in C builtins (sum/map) rather than Python frames.
+
+
+def _slope_kernel(micros: List[int], y: List[float]) -> float:
+    """
+    Least-squares slope of y per second (at least two points).
+
+    One pass: each x (seconds since the first point, keeping the sums well
+    conditioned) is folded into the running sums as it is computed, so no x
+    list is built. The offset is taken on exact integer microseconds before
+    converting to float, so x equals (timestamp - first).total_seconds().
+    """
+    t0 = micros[0]
+    sum_x = sum_y = sum_xy = sum_x2 = 0.0
+    for us, yi in zip(micros, y):
+        xi = (us - t0) / 1_000_000
+        sum_x += xi
+        sum_y += yi
+        sum_xy += xi * yi
+        sum_x2 += xi * xi
+
+    n = len(y)
+    denominator = n * sum_x2 - sum_x * sum_x
+    if abs(denominator) < 1e-10:
+        return 0.0  # Vertical line or single point
+    return (n * sum_xy - sum_x * sum_y) / denominator
+
+
+def _ema_kernel(values: List[float]) -> float:
+    """
+    EMA with alpha = 2 / (n + 1), seeded with the first value.
+
+    The recurrence is iterated directly over the values: indexing costs a
+    lookup per element, and closed forms (sum of decay ** k weighted values)
+    build or compute more per element than they save in pure Python.
+    """
+    alpha = 2.0 / (len(values) + 1)
+    decay = 1 - alpha
+    ema = values[0]
+    for v in islice(values, 1, None):
+        ema = alpha * v + decay * ema
+    return ema
+
+
+def _std_kernel(values: List[float], mean: Optional[float] = None) -> float:
+    """Sample standard deviation (at least two values), reusing mean if given."""
+    n = len(values)
+    if mean is None:
+        mean = math.fsum(values) / n
+    deviations = [v - mean for v in values]
+    return math.sqrt(sum(map(mul, deviations, deviations)) / (n - 1))
+
+
+def _percentile_kernel(values: List[float], p: float) -> float:
+    """Linearly interpolated percentile of sorted values."""
+    n = len(values)
+    if n == 1:
+        return values[0]
+
+    k = (p / 100) * (n - 1)
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return values[int(k)]
+    return values[int(f)] * (c - k) + values[int(c)] * (k - f)
+
+
+@dataclass
+class WindowSummary:
+    """
+    Summary statistics of the non-null values in one window.
+
+    first and last are the earliest and latest non-null values (the delta
+    endpoints), not necessarily the values of the first and last points.
+    """
+
+    __slots__ = ("n", "mean", "min", "max", "std", "first", "last")
+
+    n: int
+    mean: float
+    min: float
+    max: float
+    std: Optional[float]  # Sample standard deviation; None when n < 2
+    first: float
+    last: float
+
+
+class SlidingWindowAggregator:
+    """
+    Incremental sma/count/min/max over a time window that only moves forward.
+
+    Where the same window is evaluated at successive reference times (a
+    timeline scan), re-filtering the series for every tick costs O(n) per
+    operator. This keeps a running sum and count, plus monotonic deques for
+    min and max, so each point is added and evicted once: amortized O(1) per
+    update, and every aggregate is read in O(1). The sum is exact (fixed-point
+    integer), so sma equals TemporalOperators.sma bit for bit however many
+    points have passed through the window.
+
+    Window bounds and null handling match TemporalOperators: a point is in
+    the window when reference_time - window <= timestamp <= reference_time,
+    count includes null observations, and the other aggregates ignore them.
+
+    Usage:
+        agg = SlidingWindowAggregator(6 * 3600)
+        for dp in points_up_to(t):
+            agg.push(dp.timestamp, dp.value)
+        agg.advance(t)
+        agg.value("sma")
+    """
+
+    OPERATORS = ("sma", "count", "min", "max")
+
+    __slots__ = ("window", "_points", "_sum", "_n", "_nonfinite", "_min", "_max")
+
+    def __init__(self, window_seconds: int):
+        self.window = window_delta(window_seconds)
+        self._points: deque = deque()  # (timestamp, value), nulls included
+        self._sum = 0  # exact sum of finite values, scaled by _FIXED_ONE
+        self._n = 0  # non-null values in window
+        self._nonfinite = 0  # inf/nan values in window (not in _sum)
+        # Monotonic deques of (timestamp, value): the front is the current
+        # min (ascending values) / max (descending values)
+        self._min: deque = deque()
+        self._max: deque = deque()
+
+    def push(self, timestamp: datetime, value: Optional[float]) -> None:
+        """Add an observation (timestamps must not decrease)."""
+        self._points.append((timestamp, value))
+        if value is None:
+            return
+        if math.isfinite(value):
+            self._sum += _to_fixed(value)
+        else:
+            self._nonfinite += 1
+        self._n += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((timestamp, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((timestamp, value))
+
+    def advance(self, reference_time: datetime) -> None:
+        """Evict observations older than reference_time - window."""
+        window_start = reference_time - self.window
+        points = self._points
+        while points and points[0][0] < window_start:
+            _, value = points.popleft()
+            if value is not None:
+                if math.isfinite(value):
+                    self._sum -= _to_fixed(value)
+                else:
+                    self._nonfinite -= 1
+                self._n -= 1
+        while self._min and self._min[0][0] < window_start:
+            self._min.popleft()
+        while self._max and self._max[0][0] < window_start:
+            self._max.popleft()
+
+    @property
+    def count(self) -> int:
+        return len(self._points)
+
+    @property
+    def sma(self) -> Optional[float]:
+        if not self._n:
+            return None
+        if self._nonfinite:
+            # Rare: let fsum apply its inf/nan rules, as TemporalOperators.sma does
+            return math.fsum(v for _, v in self._points if v is not None) / self._n
+        return self._sum / _FIXED_ONE / self._n
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max[0][1] if self._max else None
+
+    def value(self, operator: str) -> Optional[float]:
+        """Current value of one of OPERATORS."""
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Operator '{operator}' is not incremental")
+        return getattr(self, operator)
+
+
 class TemporalOperators:
     """
     Temporal operators for PSDL trend computation.
 
-    These operators work on lists of DataPoint objects sorted by timestamp.
-    All window-based operators filter data to the specified time window
-    before computing.
+    These operators work on lists of DataPoint objects (or a DataSeries)
+    sorted by timestamp. All window-based operators filter data to the
+    specified time window before computing.
 
     Null Handling:
     - count() includes all observations (even nulls)
@@ -49,49 +536,57 @@ class TemporalOperators:
 
     @staticmethod
     def filter_by_window(
-        data: List[DataPoint],
+        data: SeriesLike,
         window_seconds: int,
         reference_time: Optional[datetime] = None,
-    ) -> List[DataPoint]:
+    ) -> SeriesLike:
         """
         Filter data points to those within the time window.
 
         Args:
-            data: List of DataPoints sorted by timestamp (ascending)
+            data: List of DataPoints (or DataSeries) sorted by timestamp (ascending)
             window_seconds: Window size in seconds
             reference_time: End of window (defaults to now)
 
         Returns:
-            Filtered list of DataPoints within the window (includes nulls)
+            Filtered DataPoints within the window (includes nulls), as a
+            DataSeries if one was given
         """
         if not data:
-            return []
-
-        ref_time = reference_time or datetime.now()
-        window_start = ref_time - timedelta(seconds=window_seconds)
+            return data[:0] if isinstance(data, DataSeries) else []
 
-        return [dp for dp in data if window_start <= dp.timestamp <= ref_time]
+        lo, hi = _window_bounds(data, window_seconds, reference_time)
+        return data[lo:hi]
 
     @staticmethod
-    def filter_non_null(data: List[DataPoint]) -> List[DataPoint]:
+    def filter_non_null(data: SeriesLike) -> SeriesLike:
         """
         Filter out data points with null values.
 
         Args:
-            data: List of DataPoints
+            data: List of DataPoints (or DataSeries)
 
         Returns:
-            List of DataPoints with non-null values only
+            DataPoints with non-null values only, as a DataSeries if one was given
         """
+        if isinstance(data, DataSeries):
+            pairs = [(ts, v) for ts, v in zip(data.timestamps, data.values) if v is not None]
+            return DataSeries([ts for ts, _ in pairs], [v for _, v in pairs])
         return [dp for dp in data if dp.value is not None]
 
     @staticmethod
-    def last(data: List[DataPoint]) -> Optional[float]:
+    def last(
+        data: SeriesLike,
+        window_seconds: Optional[int] = None,
+        reference_time: Optional[datetime] = None,
+    ) -> Optional[float]:
         """
         Get the most recent value.
 
         Args:
             data: List of DataPoints sorted by timestamp
+            window_seconds: Ignored (pointwise operator)
+            reference_time: Ignored (pointwise operator)
 
         Returns:
             Most recent value, or None if no data
@@ -101,12 +596,18 @@ class TemporalOperators:
         return data[-1].value
 
     @staticmethod
-    def exists(data: List[DataPoint]) -> bool:
+    def exists(
+        data: List[DataPoint],
+        window_seconds: Optional[int] = None,
+        reference_time: Optional[datetime] = None,
+    ) -> bool:
         """
         Check if any data exists for the signal.
 
         Args:
             data: List of DataPoints sorted by timestamp
+            window_seconds: Ignored (pointwise operator)
+            reference_time: Ignored (pointwise operator)
 
         Returns:
             True if any data points exist, False otherwise
@@ -114,12 +615,18 @@ class TemporalOperators:
         return len(data) > 0
 
     @staticmethod
-    def missing(data: List[DataPoint]) -> bool:
+    def missing(
+        data: List[DataPoint],
+        window_seconds: Optional[int] = None,
+        reference_time: Optional[datetime] = None,
+    ) -> bool:
         """
         Check if no data exists for the signal (inverse of exists).
 
         Args:
             data: List of DataPoints sorted by timestamp
+            window_seconds: Ignored (pointwise operator)
+            reference_time: Ignored (pointwise operator)
 
         Returns:
             True if no data points exist, False otherwise
@@ -143,10 +650,13 @@ class TemporalOperators:
         Returns:
             First value in window, or None if no data
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        if not filtered:
+        if not data:
+            return None
+
+        lo, hi = _window_bounds(data, window_seconds, reference_time)
+        if lo >= hi:
             return None
-        return filtered[0].value
+        return data[lo].value
 
     @staticmethod
     def delta(
@@ -166,15 +676,29 @@ class TemporalOperators:
         Returns:
             Absolute change, or None if insufficient data (< 2 non-null values)
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if len(non_null) < 2:
+        if not data:
             return None
 
-        first_val = non_null[0].value
-        last_val = non_null[-1].value
-        return last_val - first_val
+        # First and last non-null values in window per spec, found by walking
+        # in from both ends of the window (no list is built)
+        lo, hi = _window_bounds(data, window_seconds, reference_time)
+        values = data.values if isinstance(data, DataSeries) else None
+        first = last = None
+        i, j = lo, hi - 1
+        while i < j:
+            first = values[i] if values is not None else data[i].value
+            if first is not None:
+                break
+            i += 1
+        while j > i:
+            last = values[j] if values is not None else data[j].value
+            if last is not None:
+                break
+            j -= 1
+        if first is None or last is None or i >= j:
+            return None
+
+        return last - first
 
     @staticmethod
     def slope(
@@ -194,29 +718,12 @@ class TemporalOperators:
         Returns:
             Slope (units per second), or None if insufficient data (< 2 non-null values)
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if len(non_null) < 2:
+        # Non-null points in window per spec
+        x, y = _window_xy(data, window_seconds, reference_time)
+        if len(y) < 2:
             return None
 
-        # Convert timestamps to seconds from first point
-        t0 = non_null[0].timestamp
-        x = [(dp.timestamp - t0).total_seconds() for dp in non_null]
-        y = [dp.value for dp in non_null]
-
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-        sum_x2 = sum(xi * xi for xi in x)
-
-        denominator = n * sum_x2 - sum_x * sum_x
-        if abs(denominator) < 1e-10:
-            return 0.0  # Vertical line or single point
-
-        slope = (n * sum_xy - sum_x * sum_y) / denominator
-        return slope
+        return _slope_kernel(x, y)
 
     @staticmethod
     def sma(
@@ -235,13 +742,12 @@ class TemporalOperators:
         Returns:
             Simple moving average, or None if no non-null data
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if not non_null:
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if not values:
             return None
 
-        return sum(dp.value for dp in non_null) / len(non_null)
+        return math.fsum(values) / len(values)
 
     @staticmethod
     def ema(
@@ -261,25 +767,13 @@ class TemporalOperators:
         Returns:
             Exponential moving average, or None if no non-null data
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if not non_null:
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if not values:
             return None
 
-        if len(non_null) == 1:
-            return non_null[0].value
-
-        # Calculate span based on number of points
-        span = len(non_null)
-        alpha = 2.0 / (span + 1)
-
-        # Calculate EMA
-        ema = non_null[0].value
-        for dp in non_null[1:]:
-            ema = alpha * dp.value + (1 - alpha) * ema
-
-        return ema
+        # Span is the number of points in the window
+        return _ema_kernel(values)
 
     @staticmethod
     def min_val(
@@ -298,12 +792,11 @@ class TemporalOperators:
         Returns:
             Minimum value, or None if no non-null data
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if not non_null:
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if not values:
             return None
-        return min(dp.value for dp in non_null)
+        return min(values)
 
     @staticmethod
     def max_val(
@@ -322,12 +815,11 @@ class TemporalOperators:
         Returns:
             Maximum value, or None if no non-null data
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if not non_null:
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if not values:
             return None
-        return max(dp.value for dp in non_null)
+        return max(values)
 
     @staticmethod
     def count(
@@ -349,8 +841,11 @@ class TemporalOperators:
         Returns:
             Number of observations in window (including nulls)
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        return len(filtered)
+        if not data:
+            return 0
+
+        lo, hi = _window_bounds(data, window_seconds, reference_time)
+        return hi - lo
 
     @staticmethod
     def std(
@@ -369,15 +864,12 @@ class TemporalOperators:
         Returns:
             Standard deviation, or None if insufficient non-null data (< 2 values)
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if len(non_null) < 2:
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if len(values) < 2:
             return None
 
-        mean = sum(dp.value for dp in non_null) / len(non_null)
-        variance = sum((dp.value - mean) ** 2 for dp in non_null) / (len(non_null) - 1)
-        return math.sqrt(variance)
+        return _std_kernel(values)
 
     @staticmethod
     def percentile(
@@ -398,27 +890,66 @@ class TemporalOperators:
         Returns:
             Percentile value, or None if no non-null data
         """
-        filtered = TemporalOperators.filter_by_window(data, window_seconds, reference_time)
-        # Filter out null values per spec
-        non_null = TemporalOperators.filter_non_null(filtered)
-        if not non_null:
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if not values:
             return None
 
-        values = sorted(dp.value for dp in non_null)
-        n = len(values)
+        # The extremes are order statistics a linear scan finds without sorting
+        if p <= 0:
+            return min(values)
+        if p >= 100:
+            return max(values)
+
+        return _percentile_kernel(
+            _sorted_window_values(data, values, window_seconds, reference_time), p
+        )
+
+    @staticmethod
+    def summary(
+        data: List[DataPoint],
+        window_seconds: int,
+        reference_time: Optional[datetime] = None,
+    ) -> Optional[WindowSummary]:
+        """
+        Compute sma, min, max, std and the delta endpoints in one go.
 
-        if n == 1:
-            return values[0]
+        The window is selected once and the mean is shared with std, where
+        calling each operator separately repeats both. For a DataSeries the
+        result is cached with the window selection.
 
-        # Linear interpolation
-        k = (p / 100) * (n - 1)
-        f = math.floor(k)
-        c = math.ceil(k)
+        Args:
+            data: List of DataPoints sorted by timestamp
+            window_seconds: Window size in seconds
+            reference_time: End of window
 
-        if f == c:
-            return values[int(k)]
+        Returns:
+            WindowSummary, or None if no non-null data
+        """
+        cache = _series_window_cache(data, reference_time) if isinstance(data, DataSeries) else None
+        key = ("summary", window_seconds, reference_time)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        # Non-null values in window per spec
+        values = _window_values(data, window_seconds, reference_time)
+        if not values:
+            return None
 
-        return values[int(f)] * (c - k) + values[int(c)] * (k - f)
+        n = len(values)
+        mean = math.fsum(values) / n
+        result = WindowSummary(
+            n=n,
+            mean=mean,
+            min=min(values),
+            max=max(values),
+            std=_std_kernel(values, mean) if n >= 2 else None,
+            first=values[0],
+            last=values[-1],
+        )
+        if cache is not None:
+            cache[key] = result
+        return result
 
 
 # Operator registry for dynamic lookup
@@ -435,12 +966,15 @@ OPERATORS = {
     "std": TemporalOperators.std,
     "stddev": TemporalOperators.std,  # Alias for std
     "percentile": TemporalOperators.percentile,
-    # Pointwise operators
-    "last": lambda data, *args: TemporalOperators.last(data),
-    "exists": lambda data, *args: TemporalOperators.exists(data),
-    "missing": lambda data, *args: TemporalOperators.missing(data),
+    # Pointwise operators (accept and ignore the window arguments, so every
+    # entry is called as op(data, window_seconds, reference_time))
+    "last": TemporalOperators.last,
+    "exists": TemporalOperators.exists,
+    "missing": TemporalOperators.missing,
 }
 
+POINTWISE_OPERATORS = frozenset({"last", "exists", "missing"})
+
 
 def apply_operator(
     operator: str,
@@ -462,17 +996,12 @@ def apply_operator(
     Returns:
         Computed value, or None if computation fails
     """
-    if operator not in OPERATORS:
+    op_func = OPERATORS.get(operator)
+    if op_func is None:
         raise ValueError(f"Unknown operator: {operator}")
 
-    op_func = OPERATORS[operator]
-
-    # Pointwise operators (no window required)
-    if operator in ("last", "exists", "missing"):
-        return op_func(data)
-
     # Windowed operators require window
-    if window_seconds is None:
+    if window_seconds is None and operator not in POINTWISE_OPERATORS:
         raise ValueError(f"Operator '{operator}' requires a window specification")
 
     # Percentile requires additional parameter
@@ -482,3 +1011,64 @@ def apply_operator(
         return TemporalOperators.percentile(data, window_seconds, percentile_value, reference_time)
 
     return op_func(data, window_seconds, reference_time)
+
+
+# Operators answered by a WindowSummary field
+_SUMMARY_FIELDS = {"sma": "mean", "min": "min", "max": "max", "std": "std", "stddev": "std"}
+
+
+def apply_operators(
+    operations: Dict[str, Tuple[str, str, Optional[int]]],
+    data_by_signal: Dict[str, SeriesLike],
+    reference_time: Optional[datetime] = None,
+) -> Dict[str, Optional[float]]:
+    """
+    Apply several named operators over shared signal data.
+
+    Each signal is converted to a DataSeries once, and operations are run
+    grouped by (signal, window) against a single reference time, so the
+    window selection for a group is made once and reused by every operator
+    over it (see _series_window_cache) instead of once per operator.
+
+    Args:
+        operations: Result name -> (operator, signal, window_seconds);
+            window_seconds is None for pointwise operators
+        data_by_signal: DataPoints (or DataSeries) for each signal
+        reference_time: Reference time for every window (defaults to now)
+
+    Returns:
+        Result name -> computed value, in the order of operations. Operations
+        on a signal with no data yield None.
+    """
+    ref_time = reference_time or datetime.now()
+
+    groups: Dict[Tuple[str, Optional[int]], List[str]] = {}
+    for name, (_, signal, window_seconds) in operations.items():
+        groups.setdefault((signal, window_seconds), []).append(name)
+
+    series: Dict[str, DataSeries] = {}
+    computed: Dict[str, Optional[float]] = {}
+    for (signal, window_seconds), names in groups.items():
+        data = series.get(signal)
+        if data is None:
+            raw = data_by_signal.get(signal) or []
+            data = raw if isinstance(raw, DataSeries) else DataSeries.from_points(raw)
+            series[signal] = data
+
+        # Several summary statistics over one window: compute them together
+        summarized = [name for name in names if operations[name][0] in _SUMMARY_FIELDS]
+        if data and window_seconds is not None and len(summarized) >= 2:
+            summary = TemporalOperators.summary(data, window_seconds, ref_time)
+            for name in summarized:
+                field = _SUMMARY_FIELDS[operations[name][0]]
+                computed[name] = getattr(summary, field) if summary is not None else None
+
+        for name in names:
+            if name in computed:
+                continue
+            if not data:
+                computed[name] = None
+                continue
+            computed[name] = apply_operator(operations[name][0], data, window_seconds, ref_time)
+
+    return {name: computed[name] for name in operations}
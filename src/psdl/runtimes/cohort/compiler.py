@@ -34,6 +34,7 @@ import logging
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple
 
 from ..batch import BatchResult, SQLBatchRuntime
@@ -72,6 +73,23 @@ WINDOW_UNITS = {
     "w": 604800,
 }
 
+# Trend expression patterns, compiled once and tried in order by
+# parse_trend_expression (anchored at the start, like re.match)
+WINDOW_PATTERN = re.compile(r"(\d+)([smhdw])")
+_CMP = r"\s*(>=|<=|>|<|==|!=)\s*([\d.\-]+)"
+# op(signal, window) cmp value
+WINDOWED_CMP_PATTERN = re.compile(r"(\w+)\s*\(\s*(\w+)\s*,\s*(\d+[smhdw])\s*\)" + _CMP)
+# op(signal, window)
+WINDOWED_PATTERN = re.compile(r"(\w+)\s*\(\s*(\w+)\s*,\s*(\d+[smhdw])\s*\)")
+# percentile(signal, window, p) cmp value
+PERCENTILE_CMP_PATTERN = re.compile(
+    r"percentile\s*\(\s*(\w+)\s*,\s*(\d+[smhdw])\s*,\s*([\d.]+)\s*\)" + _CMP
+)
+# op(signal) cmp value
+POINTWISE_CMP_PATTERN = re.compile(r"(\w+)\s*\(\s*(\w+)\s*\)" + _CMP)
+# op(signal)
+POINTWISE_PATTERN = re.compile(r"(\w+)\s*\(\s*(\w+)\s*\)")
+
 
 class QueryComplexity(Enum):
     """Estimated query complexity level."""
@@ -149,9 +167,10 @@ class CompiledSQL:
     batch_info: Optional[Dict[str, Any]] = None  # batch_number, total_batches, offset, limit
 
 
+@lru_cache(maxsize=256)
 def parse_window(window_str: str) -> int:
-    """Parse window string like '48h' into seconds."""
-    match = re.match(r"(\d+)([smhdw])", window_str)
+    """Parse window string like '48h' into seconds (memoized per string)."""
+    match = WINDOW_PATTERN.match(window_str)
     if not match:
         raise ValueError(f"Invalid window format: {window_str}")
     value = int(match.group(1))
@@ -173,43 +192,30 @@ def parse_trend_expression(
         For pointwise operators, window is None.
         For expressions without threshold, threshold and comparison_op are None.
     """
-    # Pattern for windowed operators with comparison: op(signal, window) cmp value
-    windowed_pattern = (
-        r"(\w+)\s*\(\s*(\w+)\s*,\s*(\d+[smhdw])\s*\)\s*(>=|<=|>|<|==|!=)\s*([\d.\-]+)"
-    )
-    match = re.match(windowed_pattern, expr.strip())
+    expr = expr.strip()
+
+    match = WINDOWED_CMP_PATTERN.match(expr)
     if match:
         op, signal, window, cmp_op, threshold = match.groups()
         return (op, signal, window, float(threshold), cmp_op)
 
-    # Pattern for windowed operators without comparison: op(signal, window)
-    windowed_no_cmp = r"(\w+)\s*\(\s*(\w+)\s*,\s*(\d+[smhdw])\s*\)"
-    match = re.match(windowed_no_cmp, expr.strip())
+    match = WINDOWED_PATTERN.match(expr)
     if match:
         op, signal, window = match.groups()
         return (op, signal, window, None, None)
 
-    # Pattern for percentile: percentile(signal, window, p) cmp value
-    percentile_pattern = (
-        r"percentile\s*\(\s*(\w+)\s*,\s*(\d+[smhdw])\s*,\s*([\d.]+)\s*\)"
-        r"\s*(>=|<=|>|<|==|!=)\s*([\d.\-]+)"
-    )
-    match = re.match(percentile_pattern, expr.strip())
+    match = PERCENTILE_CMP_PATTERN.match(expr)
     if match:
         signal, window, p_value, cmp_op, threshold = match.groups()
         # Store percentile value in operator name for later extraction
         return (f"percentile:{p_value}", signal, window, float(threshold), cmp_op)
 
-    # Pattern for pointwise operators with comparison: op(signal) cmp value
-    pointwise_pattern = r"(\w+)\s*\(\s*(\w+)\s*\)\s*(>=|<=|>|<|==|!=)\s*([\d.\-]+)"
-    match = re.match(pointwise_pattern, expr.strip())
+    match = POINTWISE_CMP_PATTERN.match(expr)
     if match:
         op, signal, cmp_op, threshold = match.groups()
         return (op, signal, None, float(threshold), cmp_op)
 
-    # Pattern for pointwise operators without comparison: op(signal)
-    pointwise_no_cmp = r"(\w+)\s*\(\s*(\w+)\s*\)"
-    match = re.match(pointwise_no_cmp, expr.strip())
+    match = POINTWISE_PATTERN.match(expr)
     if match:
         op, signal = match.groups()
         return (op, signal, None, None, None)
@@ -31,14 +31,63 @@ Usage:
 
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from types import CodeType
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ...core.ir import EvaluationResult as StandardEvaluationResult
 from ...core.ir import LogicExpr, PSDLScenario, Signal, TrendExpr
-from ...operators import DataPoint, TemporalOperators, apply_operator
+from ...operators import (
+    DataPoint,
+    DataSeries,
+    SlidingWindowAggregator,
+    TemporalOperators,
+    apply_operators,
+    window_delta,
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_logic(
+    expr: str, terms: Tuple[str, ...]
+) -> Tuple[Optional[CodeType], Tuple[Tuple[str, str], ...], bool]:
+    """
+    Compile a logic expression once for repeated evaluation.
+
+    Each term is replaced (case-insensitively, longest first to avoid partial
+    replacements) by a placeholder variable and the logic operators are
+    converted to Python, so evaluating the expression only binds term values
+    instead of rewriting and re-parsing the string every time.
+
+    Returns:
+        Tuple of (code object, or None if the expression is not valid Python;
+        (term, variable) pairs; whether the expression contains comparisons)
+    """
+    # v0.3: Check if expression contains comparison operators
+    has_comparison = any(op in expr for op in [">=", "<=", ">", "<", "==", "!="])
+
+    variables = []
+    for term in sorted(terms, key=len, reverse=True):
+        variable = f"_psdl_term_{len(variables)}"
+        pattern = r"\b" + re.escape(term) + r"\b"
+        expr = re.sub(pattern, variable, expr, flags=re.IGNORECASE)
+        variables.append((term, variable))
+
+    # Convert logic operators to Python
+    expr = expr.replace(" AND ", " and ").replace(" and ", " and ")
+    expr = expr.replace(" OR ", " or ").replace(" or ", " or ")
+    expr = re.sub(r"\bNOT\s+", "not ", expr, flags=re.IGNORECASE)
+
+    try:
+        code: Optional[CodeType] = compile(expr, "<psdl logic>", "eval")
+    except (SyntaxError, ValueError):
+        code = None
+    return code, tuple(variables), has_comparison
 
 
 @dataclass
@@ -166,6 +215,74 @@ class DataBackend(ABC):
         """
         pass
 
+    def fetch_signal_data_batch(
+        self,
+        patient_ids: List[Any],
+        signal: Signal,
+        window_seconds: int,
+        reference_time: datetime,
+    ) -> Dict[Any, List[DataPoint]]:
+        """
+        Fetch time-series data for a signal across many patients.
+
+        The default implementation calls fetch_signal_data() once per patient.
+        Backends that can serve a whole cohort in a single round-trip override
+        this and declare the "batch_fetch" capability.
+
+        Args:
+            patient_ids: Patient identifiers
+            signal: Signal definition
+            window_seconds: How far back to fetch
+            reference_time: End of the time window
+
+        Returns:
+            Dict mapping every requested patient ID to its DataPoints
+            sorted by timestamp (ascending)
+        """
+        return {
+            patient_id: self.fetch_signal_data(
+                patient_id=patient_id,
+                signal=signal,
+                window_seconds=window_seconds,
+                reference_time=reference_time,
+            )
+            for patient_id in patient_ids
+        }
+
+    def fetch_patient_signals(
+        self,
+        patient_id: Any,
+        signals: Dict[str, Signal],
+        window_seconds: int,
+        reference_time: datetime,
+    ) -> Dict[str, List[DataPoint]]:
+        """
+        Fetch several signals for one patient.
+
+        The default implementation calls fetch_signal_data() once per signal.
+        Backends that can serve several signals in a single round-trip
+        override this.
+
+        Args:
+            patient_id: Patient identifier
+            signals: Signal definitions keyed by signal name
+            window_seconds: How far back to fetch
+            reference_time: End of the time window
+
+        Returns:
+            Dict mapping every signal name to its DataPoints sorted by
+            timestamp (ascending)
+        """
+        return {
+            name: self.fetch_signal_data(
+                patient_id=patient_id,
+                signal=signal,
+                window_seconds=window_seconds,
+                reference_time=reference_time,
+            )
+            for name, signal in signals.items()
+        }
+
     # v0.4 (RFC-0008): Lifecycle methods
 
     def connect(self) -> None:
@@ -191,6 +308,7 @@ class DataBackend(ABC):
 
         Known capabilities:
         - "dataset_adapter": supports resolve_binding() and fetch_events()
+        - "batch_fetch": fetch_signal_data_batch() serves a cohort in one query
         """
         return set()
 
@@ -231,7 +349,7 @@ class InMemoryBackend(DataBackend):
         """Add signal data for a patient."""
         if patient_id not in self.data:
             self.data[patient_id] = {}
-        self.data[patient_id][signal_name] = sorted(data, key=lambda dp: dp.timestamp)
+        self.data[patient_id][signal_name] = sorted(data, key=attrgetter("timestamp"))
         self.patients.add(patient_id)
 
     def add_observation(self, patient_id: Any, signal_name: str, value: float, timestamp: datetime):
@@ -244,12 +362,13 @@ class InMemoryBackend(DataBackend):
             value: Observation value
             timestamp: When the observation was recorded
         """
-        if patient_id not in self.data:
-            self.data[patient_id] = {}
-        if signal_name not in self.data[patient_id]:
-            self.data[patient_id][signal_name] = []
-        self.data[patient_id][signal_name].append(DataPoint(timestamp=timestamp, value=value))
-        self.data[patient_id][signal_name].sort(key=lambda dp: dp.timestamp)
+        signal_data = self.data.setdefault(patient_id, {}).setdefault(signal_name, [])
+        in_order = not signal_data or signal_data[-1].timestamp <= timestamp
+        signal_data.append(DataPoint(timestamp=timestamp, value=value))
+        # Observations usually arrive in time order; only a late one needs a
+        # (stable) re-sort
+        if not in_order:
+            signal_data.sort(key=attrgetter("timestamp"))
         self.patients.add(patient_id)
 
     def add_patient(self, patient_id: Any, **attributes):
@@ -399,50 +518,63 @@ class SinglePatientEvaluator:
         return max_window
 
     def _fetch_all_signals(
-        self, patient_id: Any, reference_time: datetime
+        self,
+        patient_id: Any,
+        reference_time: datetime,
+        window_seconds: Optional[int] = None,
     ) -> Dict[str, List[DataPoint]]:
-        """Fetch all signal data for a patient."""
-        signal_data = {}
-
-        for name, signal in self.scenario.signals.items():
-            data = self.backend.fetch_signal_data(
-                patient_id=patient_id,
-                signal=signal,
-                window_seconds=self._max_window_seconds,
-                reference_time=reference_time,
-            )
-            signal_data[name] = data
-
-        return signal_data
+        """Fetch all signal data for a patient (default window: max trend window)."""
+        return self.backend.fetch_patient_signals(
+            patient_id=patient_id,
+            signals=self.scenario.signals,
+            window_seconds=window_seconds or self._max_window_seconds,
+            reference_time=reference_time,
+        )
 
-    def _evaluate_trend(
+    def _prefetch_signals(
         self,
-        trend: TrendExpr,
-        signal_data: Dict[str, List[DataPoint]],
+        patient_ids: List[Any],
         reference_time: datetime,
-    ) -> Tuple[Optional[float], bool]:
+        max_workers: Optional[int] = None,
+    ) -> Dict[Any, Dict[str, List[DataPoint]]]:
         """
-        Evaluate a single trend expression.
+        Fetch all signal data for a cohort, one batch request per signal.
 
-        Returns:
-            Tuple of (computed_value, threshold_result)
+        Duplicate IDs are fetched once; the result is keyed by unique patient ID.
+        With max_workers set, the per-signal requests run concurrently
+        (None=serial, 0=auto).
         """
-        data = signal_data.get(trend.signal, [])
 
-        if not data:
-            return None, False
+        unique_ids = list(dict.fromkeys(patient_ids))
 
-        # Get window in seconds
-        window_seconds = trend.window.seconds if trend.window else self._max_window_seconds
+        def fetch(signal: Signal) -> Dict[Any, List[DataPoint]]:
+            return self.backend.fetch_signal_data_batch(
+                patient_ids=unique_ids,
+                signal=signal,
+                window_seconds=self._max_window_seconds,
+                reference_time=reference_time,
+            )
 
-        # Apply operator
-        value = apply_operator(
-            operator=trend.operator,
-            data=data,
-            window_seconds=window_seconds,
-            reference_time=reference_time,
-        )
+        signals = self.scenario.signals
+        if max_workers is None or len(signals) < 2:
+            batches = {name: fetch(signal) for name, signal in signals.items()}
+        else:
+            workers = max_workers if max_workers > 0 else None
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {name: executor.submit(fetch, signal) for name, signal in signals.items()}
+                batches = {name: future.result() for name, future in futures.items()}
+
+        cohort_data: Dict[Any, Dict[str, List[DataPoint]]] = {pid: {} for pid in unique_ids}
+        for name, batch in batches.items():
+            for patient_id, signal_data in cohort_data.items():
+                signal_data[name] = batch.get(patient_id, [])
+
+        return cohort_data
 
+    def _trend_result(
+        self, trend: TrendExpr, value: Optional[float]
+    ) -> Tuple[Optional[float], bool]:
+        """Apply a trend's threshold (if any) to its computed value."""
         if value is None:
             return None, False
 
@@ -472,47 +604,29 @@ class SinglePatientEvaluator:
         NULL handling: If any trend value used in a comparison is None,
         the comparison evaluates to False (SQL-like semantics).
         """
-        expr = logic.expr
-
-        # v0.3: Check if expression contains comparison operators
-        has_comparison = any(op in expr for op in [">=", "<=", ">", "<", "==", "!="])
-
-        # Replace term names with their values
-        # Process in order of length (longest first) to avoid partial replacements
-        terms_by_length = sorted(logic.terms, key=len, reverse=True)
+        code, variables, has_comparison = _compile_logic(logic.expr, tuple(logic.terms))
+        if code is None:
+            return False
 
-        for term in terms_by_length:
+        # Bind each term's value to its placeholder variable
+        namespace: Dict[str, Any] = {"True": True, "False": False, "None": None}
+        for term, variable in variables:
             if has_comparison and trend_values and term in trend_values:
-                # v0.3: Use numeric trend value for comparisons
-                value = trend_values.get(term)
-                if value is None:
-                    # NULL comparison semantics: if value is None, replace with
-                    # a marker that makes the comparison False
-                    # We use "None" as a Python literal that will make comparisons fail safely
-                    replacement = "None"
-                else:
-                    replacement = str(value)
+                # v0.3: Use numeric trend value for comparisons. A None value
+                # makes the comparison raise TypeError (NULL semantics below)
+                namespace[variable] = trend_values.get(term)
             else:
                 # Use boolean result from trends or logic
                 value = trend_results.get(term)
                 if value is None:
                     value = logic_results.get(term, False)
-                replacement = str(value)
-
-            # Replace term with value (case-insensitive)
-            pattern = r"\b" + re.escape(term) + r"\b"
-            expr = re.sub(pattern, replacement, expr, flags=re.IGNORECASE)
-
-        # Convert logic operators to Python
-        expr = expr.replace(" AND ", " and ").replace(" and ", " and ")
-        expr = expr.replace(" OR ", " or ").replace(" or ", " or ")
-        expr = re.sub(r"\bNOT\s+", "not ", expr, flags=re.IGNORECASE)
+                namespace[variable] = value
 
         # Evaluate the expression safely
         try:
             # Allow boolean and comparison operations
             # None comparisons will raise TypeError, which we catch and return False
-            result = eval(expr, {"__builtins__": {}}, {"True": True, "False": False, "None": None})
+            result = eval(code, {"__builtins__": {}}, namespace)
             return bool(result)
         except TypeError:
             # None comparison (e.g., None < 92) - return False per NULL semantics
@@ -539,14 +653,44 @@ class SinglePatientEvaluator:
         # Fetch all signal data
         signal_data = self._fetch_all_signals(patient_id, ref_time)
 
+        return self._evaluate_signals(patient_id, ref_time, signal_data)
+
+    def _evaluate_signals(
+        self,
+        patient_id: Any,
+        ref_time: datetime,
+        signal_data: Dict[str, List[DataPoint]],
+        precomputed: Optional[Dict[str, Optional[float]]] = None,
+    ) -> EvaluationResult:
+        """Evaluate trends and logic against already-fetched signal data.
+
+        Trends named in precomputed take that value instead of applying
+        their operator (thresholds are still applied).
+        """
+        # Column-oriented copy of each signal, shared by all trends
+        signal_data = {name: DataSeries.from_points(data) for name, data in signal_data.items()}
+
         # Evaluate all trends (use DAG order if available)
         trend_values: Dict[str, Optional[float]] = {}
         trend_results: Dict[str, bool] = {}
 
         trend_names = self._trend_order if self._trend_order else list(self.scenario.trends.keys())
+        precomputed = precomputed or {}
+
+        # Trends sharing a (signal, window) select that window once
+        operations = {}
+        for name in trend_names:
+            if name in precomputed:
+                continue
+            trend = self.scenario.trends[name]
+            window_seconds = trend.window.seconds if trend.window else self._max_window_seconds
+            operations[name] = (trend.operator, trend.signal, window_seconds)
+        computed = apply_operators(operations, signal_data, ref_time)
+
         for name in trend_names:
             trend = self.scenario.trends[name]
-            value, result = self._evaluate_trend(trend, signal_data, ref_time)
+            value = precomputed[name] if name in precomputed else computed[name]
+            value, result = self._trend_result(trend, value)
             trend_values[name] = value
             trend_results[name] = result
 
@@ -611,6 +755,92 @@ class SinglePatientEvaluator:
         """Legacy alias for evaluate()."""
         return self.evaluate(patient_id, reference_time)
 
+    def evaluate_timeline(
+        self,
+        patient_id: Any,
+        start_time: datetime,
+        end_time: datetime,
+        step: timedelta,
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate the scenario for one patient at regular points in time.
+
+        Signal data covering the whole span is fetched once; each step then
+        evaluates against the slice the backend would have returned for that
+        reference time. Windowed sma/count/min/max trends are maintained
+        incrementally with a SlidingWindowAggregator as the reference time
+        advances instead of re-filtering the window at every step.
+
+        Args:
+            patient_id: Patient identifier
+            start_time: First reference time
+            end_time: Last reference time (inclusive)
+            step: Interval between reference times
+
+        Returns:
+            EvaluationResult for each reference time, in chronological order
+        """
+        if step <= timedelta(0):
+            raise ValueError("step must be positive")
+
+        span_seconds = int((end_time - start_time).total_seconds())
+        full_data = self._fetch_all_signals(
+            patient_id, end_time, span_seconds + self._max_window_seconds
+        )
+        full_series = {name: DataSeries.from_points(data) for name, data in full_data.items()}
+        max_window = window_delta(self._max_window_seconds)
+
+        # Slope reads epoch microseconds; computing them on the full series lets
+        # every step's slice share the column instead of converting again
+        for trend in self.scenario.trends.values():
+            if trend.operator == "slope" and trend.signal in full_series:
+                full_series[trend.signal].ensure_micros()
+
+        # One aggregator per (signal, window) shared by its incremental trends;
+        # each tracks how far into the signal's series it has consumed
+        aggregators: Dict[Tuple[str, int], List[Any]] = {}
+        incremental: Dict[str, Tuple[str, int]] = {}
+        for name, trend in self.scenario.trends.items():
+            if trend.window and trend.operator in SlidingWindowAggregator.OPERATORS:
+                key = (trend.signal, trend.window.seconds)
+                if key not in aggregators:
+                    aggregators[key] = [SlidingWindowAggregator(trend.window.seconds), 0]
+                incremental[name] = key
+
+        results = []
+        current = start_time
+        while current <= end_time:
+            window_start = current - max_window
+            signal_data: Dict[str, DataSeries] = {}
+            for name, series in full_series.items():
+                lo = bisect_left(series.timestamps, window_start)
+                hi = bisect_right(series.timestamps, current)
+                signal_data[name] = series[lo:hi]
+
+            for (signal_name, _), state in aggregators.items():
+                series = full_series.get(signal_name)
+                if series is None:
+                    continue
+                aggregator, consumed = state
+                timestamps, values = series.timestamps, series.values
+                end = bisect_right(timestamps, current)
+                for i in range(consumed, end):
+                    aggregator.push(timestamps[i], values[i])
+                state[1] = end
+                aggregator.advance(current)
+
+            # A signal with no data in the fetch window yields None, as in
+            # apply_operators
+            precomputed = {
+                name: aggregators[key][0].value(self.scenario.trends[name].operator)
+                for name, key in incremental.items()
+                if signal_data.get(key[0])
+            }
+            results.append(self._evaluate_signals(patient_id, current, signal_data, precomputed))
+            current += step
+
+        return results
+
     def evaluate_batch(
         self,
         patient_ids: Optional[List[Any]] = None,
@@ -620,6 +850,11 @@ class SinglePatientEvaluator:
         """
         Evaluate the scenario for multiple patients.
 
+        Backends declaring the "batch_fetch" capability are queried once per
+        signal for the whole cohort (signals fetched in parallel when
+        max_workers is set); trends and logic are then evaluated in-memory
+        for each patient.
+
         Args:
             patient_ids: List of patient IDs (defaults to all patients from backend)
             reference_time: Point in time for evaluation
@@ -638,6 +873,18 @@ class SinglePatientEvaluator:
                 population_exclude=population.exclude if population else None,
             )
 
+        # Batched fetch: one round-trip per signal instead of per (patient, signal)
+        if "batch_fetch" in self.backend.capabilities:
+            patient_ids = list(patient_ids)
+            cohort_data = self._prefetch_signals(patient_ids, ref_time, max_workers)
+            results = [
+                self._evaluate_signals(patient_id, ref_time, cohort_data[patient_id])
+                for patient_id in patient_ids
+            ]
+            if max_workers is not None:
+                results.sort(key=lambda r: str(r.patient_id))
+            return results
+
         # Serial execution
         if max_workers is None:
             results = []
@@ -7,20 +7,59 @@ This creates patients with clinical data that matches our test scenarios:
 - ICU deterioration (heart rate, blood pressure)
 - Sepsis screening (temperature, lactate)
 
+Resources are uploaded in a single FHIR transaction Bundle by default; pass
+--no-transaction for servers without transaction support (one PUT per resource,
+sent concurrently over a pooled session).
+
 Usage:
     python tests/fixtures/load_fhir_test_data.py [--base-url http://localhost:8080/fhir]
 """
 
+import json
 import sys
-from datetime import datetime, timedelta
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library required. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode(resource: Dict) -> bytes:
+    """Serialize a FHIR resource (orjson when installed, else compact stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(resource)
+    return json.dumps(resource, separators=(",", ":")).encode("utf-8")
+
+
+def _fhir_datetime(timestamp: datetime) -> str:
+    """
+    Format a UTC timestamp as a FHIR dateTime (YYYY-MM-DDThh:mm:ssZ).
+
+    isoformat is a single C call, about twice as fast as the equivalent
+    strftime pattern.
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp.isoformat(timespec="seconds") + "Z"
+
+
+def _decode(response: "requests.Response") -> Dict:
+    """Parse a FHIR JSON response body."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 # LOINC codes for common clinical measurements
 LOINC = {
@@ -38,39 +77,140 @@ LOINC = {
     "gcs": "9269-2",
 }
 
+LOINC_DISPLAY = {
+    "2160-0": "Creatinine",
+    "8867-4": "Heart rate",
+    "8480-6": "Systolic blood pressure",
+    "8462-4": "Diastolic blood pressure",
+    "8310-5": "Body temperature",
+    "9279-1": "Respiratory rate",
+    "2708-6": "Oxygen saturation",
+    "2524-7": "Lactate",
+    "2823-3": "Potassium",
+    "718-7": "Hemoglobin",
+    "6690-2": "WBC",
+    "9269-2": "Glasgow coma scale",
+}
+
+# Observation.code for each known LOINC code, built once. Resources share these
+# dicts (they are only serialized), so treat them as read-only.
+_LOINC_CONCEPTS = {
+    code: {"coding": [{"system": "http://loinc.org", "code": code, "display": display}]}
+    for code, display in LOINC_DISPLAY.items()
+}
+
 
 class FHIRTestDataLoader:
     """Load test data into FHIR server."""
 
-    def __init__(self, base_url: str = "http://localhost:8080/fhir"):
+    def __init__(self, base_url: str = "http://localhost:8080/fhir", max_workers: int = 16):
         self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
         self.session = requests.Session()
+        # Keep a pooled connection per upload worker instead of reconnecting, and
+        # retry throttled / transiently failing requests with exponential backoff
+        # (urllib3's default methods: idempotent ones such as GET and PUT)
+        # Bundles we POST only contain PUTs and GETs, so retrying them is idempotent
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=max_workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "Content-Type": "application/fhir+json",
                 "Accept": "application/fhir+json",
             }
         )
+        # Transaction Bundle entries awaiting flush(); None uploads immediately
+        self._queue: Optional[List[Dict]] = None
+
+    def begin_transaction(self):
+        """Queue created resources for a single transaction Bundle upload."""
+        self._queue = []
+
+    def flush(self) -> Optional[Dict]:
+        """
+        POST queued resources as one transaction Bundle.
+
+        One request replaces a PUT round-trip per resource; the server applies
+        the entries atomically. Returns the transaction-response Bundle, or
+        None if nothing was queued.
+        """
+        entries, self._queue = self._queue, None
+        if not entries:
+            return None
+
+        bundle = {"resourceType": "Bundle", "type": "transaction", "entry": entries}
+        response = self.session.post(self.base_url, data=_encode(bundle))
+        response.raise_for_status()
+        return _decode(response)
+
+    def flush_concurrent(self) -> int:
+        """
+        PUT queued resources individually, max_workers at a time.
+
+        For servers without transaction support: the uploads are bound by
+        network latency, so overlapping them on the pooled session cuts wall
+        time by up to max_workers. Patients go first so observations never
+        reference a patient that does not exist yet. Returns the number of
+        resources uploaded.
+        """
+        entries, self._queue = self._queue, None
+        if not entries:
+            return 0
+
+        resources = [entry["resource"] for entry in entries]
+        patients = [r for r in resources if r["resourceType"] == "Patient"]
+        others = [r for r in resources if r["resourceType"] != "Patient"]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # list() re-raises the first failed upload
+            list(executor.map(self._put_now, patients))
+            list(executor.map(self._put_now, others))
+        return len(resources)
+
+    def _put(self, resource: Dict) -> Dict:
+        """Upload a resource by id, or queue it while a transaction is open."""
+        if self._queue is None:
+            self._put_now(resource)
+            return resource
+
+        url = f"{resource['resourceType']}/{resource['id']}"
+        self._queue.append(
+            {
+                "fullUrl": f"{self.base_url}/{url}",
+                "resource": resource,
+                "request": {"method": "PUT", "url": url},
+            }
+        )
+        return resource
+
+    def _put_now(self, resource: Dict) -> None:
+        """PUT a resource by id; the echoed resource is not decoded."""
+        url = f"{self.base_url}/{resource['resourceType']}/{resource['id']}"
+        response = self.session.put(url, data=_encode(resource))
+        if not 200 <= response.status_code < 300:
+            raise requests.HTTPError(f"{response.status_code} for PUT {url}", response=response)
 
     def create_patient(self, patient_id: str, name: str, birth_date: str = "1970-01-01") -> Dict:
         """Create a patient resource."""
+        # "Given Family" (extra middle words are dropped); a single word is both
+        parts = name.split() if " " in name else [name]
         patient = {
             "resourceType": "Patient",
             "id": patient_id,
             "identifier": [{"system": "http://psdl.test/patient-id", "value": patient_id}],
-            "name": [
-                {
-                    "family": name.split()[-1] if " " in name else name,
-                    "given": [name.split()[0]] if " " in name else [name],
-                }
-            ],
+            "name": [{"family": parts[-1], "given": [parts[0]]}],
             "birthDate": birth_date,
             "gender": "unknown",
         }
 
-        response = self.session.put(f"{self.base_url}/Patient/{patient_id}", json=patient)
-        response.raise_for_status()
-        return response.json()
+        return self._put(patient)
 
     def create_observation(
         self,
@@ -82,24 +222,19 @@ class FHIRTestDataLoader:
         obs_id: str = None,
     ) -> Dict:
         """Create an observation resource."""
+        effective = _fhir_datetime(timestamp)
         if obs_id is None:
-            obs_id = f"{patient_id}-{loinc_code}-{timestamp.strftime('%Y%m%d%H%M%S')}"
+            # YYYYMMDDHHMMSS, taken from the already formatted timestamp
+            compact = effective[:-1].replace("-", "").replace(":", "").replace("T", "")
+            obs_id = f"{patient_id}-{loinc_code}-{compact}"
 
         observation = {
             "resourceType": "Observation",
             "id": obs_id,
             "status": "final",
-            "code": {
-                "coding": [
-                    {
-                        "system": "http://loinc.org",
-                        "code": loinc_code,
-                        "display": self._get_loinc_display(loinc_code),
-                    }
-                ]
-            },
+            "code": self._loinc_concept(loinc_code),
             "subject": {"reference": f"Patient/{patient_id}"},
-            "effectiveDateTime": timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "effectiveDateTime": effective,
             "valueQuantity": {
                 "value": value,
                 "unit": unit,
@@ -107,27 +242,22 @@ class FHIRTestDataLoader:
             },
         }
 
-        response = self.session.put(f"{self.base_url}/Observation/{obs_id}", json=observation)
-        response.raise_for_status()
-        return response.json()
+        return self._put(observation)
 
     def _get_loinc_display(self, code: str) -> str:
         """Get display name for LOINC code."""
-        displays = {
-            "2160-0": "Creatinine",
-            "8867-4": "Heart rate",
-            "8480-6": "Systolic blood pressure",
-            "8462-4": "Diastolic blood pressure",
-            "8310-5": "Body temperature",
-            "9279-1": "Respiratory rate",
-            "2708-6": "Oxygen saturation",
-            "2524-7": "Lactate",
-            "2823-3": "Potassium",
-            "718-7": "Hemoglobin",
-            "6690-2": "WBC",
-            "9269-2": "Glasgow coma scale",
-        }
-        return displays.get(code, code)
+        return LOINC_DISPLAY.get(code, code)
+
+    def _loinc_concept(self, code: str) -> Dict:
+        """Observation.code CodeableConcept for a LOINC code."""
+        concept = _LOINC_CONCEPTS.get(code)
+        if concept is None:
+            concept = {
+                "coding": [
+                    {"system": "http://loinc.org", "code": code, "display": code},
+                ]
+            }
+        return concept
 
     def load_aki_patient_triggered(self):
         """
@@ -270,43 +400,89 @@ class FHIRTestDataLoader:
         print(f"Creating normal patient: {patient_id}")
         self.create_patient(patient_id, "Normal Patient")
 
-        # Normal creatinine
-        for i in range(4):
-            ts = now - timedelta(hours=i * 2)
-            self.create_observation(
-                patient_id, LOINC["creatinine"], 0.9 + (i % 2) * 0.1, "mg/dL", ts
-            )
-
-        # Normal heart rate
-        for i in range(4):
-            ts = now - timedelta(hours=i * 2)
-            self.create_observation(patient_id, LOINC["heart_rate"], 70 + (i % 2) * 5, "bpm", ts)
-
-        # Normal blood pressure
-        for i in range(4):
-            ts = now - timedelta(hours=i * 2)
-            self.create_observation(patient_id, LOINC["systolic_bp"], 118 + (i % 2) * 4, "mmHg", ts)
-
-        # Normal temperature
-        for i in range(4):
-            ts = now - timedelta(hours=i * 2)
-            self.create_observation(
-                patient_id, LOINC["temperature"], 36.8 + (i % 2) * 0.2, "Cel", ts
-            )
+        # Four readings, two hours apart, alternating between two normal values
+        timestamps = [now - timedelta(hours=i * 2) for i in range(4)]
+        normal_series = [
+            # (LOINC code, base value, alternate step, unit)
+            (LOINC["creatinine"], 0.9, 0.1, "mg/dL"),
+            (LOINC["heart_rate"], 70, 5, "bpm"),
+            (LOINC["systolic_bp"], 118, 4, "mmHg"),
+            (LOINC["temperature"], 36.8, 0.2, "Cel"),
+        ]
+        for loinc_code, base, step, unit in normal_series:
+            for i, ts in enumerate(timestamps):
+                self.create_observation(patient_id, loinc_code, base + (i % 2) * step, unit, ts)
 
         print("  Created all normal observations")
 
-    def load_all_test_data(self):
-        """Load all test patients."""
+    def _existing_patient_ids(self, patient_ids: List[str]) -> Set[str]:
+        """IDs among patient_ids that already exist on the server (one search)."""
+        response = self.session.get(
+            f"{self.base_url}/Patient",
+            params={"_id": ",".join(patient_ids), "_elements": "id", "_count": len(patient_ids)},
+        )
+        if not response.ok:
+            return set()
+        bundle = _decode(response)
+        return {entry["resource"]["id"] for entry in bundle.get("entry", [])}
+
+    def skip_existing_patients(self) -> Set[str]:
+        """
+        Drop queued patients that already exist, with their observations.
+
+        Lets a re-run skip the server-side parse and write of data it already
+        holds. Only safe for data loaded by a transaction (all of a patient's
+        resources or none), and note the loaded timestamps stay relative to
+        the original run. Returns the skipped patient IDs.
+        """
+        queued = [
+            e["resource"]["id"] for e in self._queue if e["resource"]["resourceType"] == "Patient"
+        ]
+        existing = self._existing_patient_ids(queued) if queued else set()
+        if existing:
+            references = {f"Patient/{pid}" for pid in existing}
+            self._queue = [
+                e
+                for e in self._queue
+                if e["resource"]["id"] not in existing
+                and e["resource"].get("subject", {}).get("reference") not in references
+            ]
+        return existing
+
+    def load_all_test_data(self, transaction: bool = True, skip_existing: bool = False):
+        """
+        Load all test patients.
+
+        Args:
+            transaction: upload everything in one transaction Bundle; False
+                sends one PUT per resource, max_workers at a time
+            skip_existing: with transaction, leave patients already on the
+                server untouched (see skip_existing_patients)
+        """
         print(f"\nLoading FHIR test data to: {self.base_url}")
         print("=" * 50)
 
+        # Resources are queued either way, then uploaded together
+        self.begin_transaction()
+
         self.load_aki_patient_triggered()
         self.load_aki_patient_stable()
         self.load_icu_deterioration_patient()
         self.load_sepsis_patient()
         self.load_normal_patient()
 
+        if transaction and skip_existing:
+            for patient_id in sorted(self.skip_existing_patients()):
+                print(f"Skipping existing patient: {patient_id}")
+
+        if transaction:
+            queued = len(self._queue)
+            self.flush()
+            print(f"Uploaded {queued} resources in one transaction Bundle")
+        else:
+            uploaded = self.flush_concurrent()
+            print(f"Uploaded {uploaded} resources ({self.max_workers} concurrent requests)")
+
         print("=" * 50)
         print("Test data loaded successfully!")
         print("\nCreated patients:")
@@ -320,19 +496,24 @@ class FHIRTestDataLoader:
         """Verify test data was loaded."""
         print("\nVerifying loaded data...")
 
-        # Count patients
-        response = self.session.get(f"{self.base_url}/Patient?_summary=count")
-        if response.ok:
-            data = response.json()
-            count = data.get("total", 0)
-            print(f"  Patients: {count}")
+        # Both counts in one batch request
+        bundle = {
+            "resourceType": "Bundle",
+            "type": "batch",
+            "entry": [
+                {"request": {"method": "GET", "url": f"{resource_type}?_summary=count"}}
+                for resource_type in ("Patient", "Observation")
+            ],
+        }
+        response = self.session.post(self.base_url, data=_encode(bundle))
+        if not response.ok:
+            return
 
-        # Count observations
-        response = self.session.get(f"{self.base_url}/Observation?_summary=count")
-        if response.ok:
-            data = response.json()
-            count = data.get("total", 0)
-            print(f"  Observations: {count}")
+        entries = _decode(response).get("entry", [])
+        for label, entry in zip(("Patients", "Observations"), entries):
+            if entry.get("response", {}).get("status", "").startswith("200"):
+                count = entry.get("resource", {}).get("total", 0)
+                print(f"  {label}: {count}")
 
 
 def main():
@@ -343,14 +524,29 @@ def main():
         "--base-url", default="http://localhost:8080/fhir", help="FHIR server base URL"
     )
     parser.add_argument("--verify-only", action="store_true", help="Only verify existing data")
+    parser.add_argument(
+        "--no-transaction",
+        action="store_true",
+        help="Upload one resource per request (for servers without transaction support)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=16, help="Concurrent requests with --no-transaction"
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Leave patients that already exist untouched (keeps their original timestamps)",
+    )
     args = parser.parse_args()
 
-    loader = FHIRTestDataLoader(args.base_url)
+    loader = FHIRTestDataLoader(args.base_url, max_workers=args.workers)
 
     if args.verify_only:
         loader.verify_data()
     else:
-        loader.load_all_test_data()
+        loader.load_all_test_data(
+            transaction=not args.no_transaction, skip_existing=args.skip_existing
+        )
         loader.verify_data()
 
 
@@ -11,13 +11,9 @@ This test module validates ALL PSDL example scenarios through complete workflows
 These tests prove that PSDL works as a complete system, not just individual components.
 """
 
-import os
-import sys
 from datetime import datetime, timedelta
 from typing import Dict, List
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 import pytest
 
 from psdl.core import PSDLParser
@@ -180,7 +176,7 @@ class PatientDataGenerator:
 class TestAKIScenarioComplete:
     """Complete end-to-end tests for AKI detection scenario."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
@@ -267,7 +263,7 @@ class TestAKIScenarioComplete:
 class TestICUScenarioComplete:
     """Complete end-to-end tests for ICU deterioration scenario."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/icu_deterioration.yaml")
@@ -329,7 +325,7 @@ class TestICUScenarioComplete:
 class TestSepsisScenarioComplete:
     """Complete end-to-end tests for sepsis screening scenario."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/sepsis_screening.yaml")
@@ -389,7 +385,7 @@ class TestSepsisScenarioComplete:
 class TestAllScenariosIntegration:
     """Integration tests running all scenarios together."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def all_scenarios(self):
         """Load all example scenarios."""
         parser = PSDLParser()
@@ -419,21 +415,19 @@ class TestAllScenariosIntegration:
             for signal_name, datapoints in data.items():
                 backend.add_data(patient_id, signal_name, datapoints)
 
-        # Run all scenarios against all patients
-        results = {}
-        for scenario_name, scenario in all_scenarios.items():
-            evaluator = PSDLEvaluator(scenario, backend)
-            scenario_results = {}
-
-            for patient_id in patients.keys():
+        # Run all scenarios against all patients, one pass over the cohort
+        evaluators = {
+            name: PSDLEvaluator(scenario, backend) for name, scenario in all_scenarios.items()
+        }
+        results = {name: {} for name in evaluators}
+        for patient_id in patients:
+            for scenario_name, evaluator in evaluators.items():
                 result = evaluator.evaluate_patient(patient_id, now)
-                scenario_results[patient_id] = {
+                results[scenario_name][patient_id] = {
                     "triggered": result.is_triggered,
                     "rules": result.triggered_logic,
                 }
 
-            results[scenario_name] = scenario_results
-
         # Print comprehensive report
         print(f"\n{'='*60}")
         print("MULTI-SCENARIO COHORT EVALUATION REPORT")
@@ -248,9 +248,9 @@ class TestBenchmarkSuite:
 class TestBenchmarkRunner:
     """Test BenchmarkRunner."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def small_data(self):
-        """Generate small test dataset."""
+        """Generate small test dataset once; the runner only reads it."""
         return generate_synthetic_data(
             num_patients=5,
             config=SyntheticDataConfig(
@@ -8,21 +8,16 @@ that PSDL correctly identifies them.
 This is critical validation - not just "does it run" but "does it work correctly".
 """
 
-import os
-import sys
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
-import random  # noqa: E402
-from dataclasses import dataclass  # noqa: E402
-from datetime import datetime, timedelta  # noqa: E402
-from typing import Dict, List  # noqa: E402
-
-import pytest  # noqa: E402
-
-from psdl.core import PSDLParser  # noqa: E402
-from psdl.operators import DataPoint  # noqa: E402
-from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator  # noqa: E402
+from psdl.core import PSDLParser
+from psdl.operators import DataPoint
+from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator
 
 PSDLEvaluator = SinglePatientEvaluator
 
@@ -258,7 +253,7 @@ class ClinicalDataGenerator:
 class TestAKIDetectionValidation:
     """Validate AKI detection produces clinically correct results."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
@@ -345,7 +340,7 @@ class TestAKIDetectionValidation:
 class TestSepsisDetectionValidation:
     """Validate sepsis detection produces clinically correct results."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/sepsis_screening.yaml")
@@ -431,9 +426,8 @@ class TestCohortValidation:
         false_positives = 0
         false_negatives = 0
 
-        for patient, _ in cohort:
-            result = evaluator.evaluate_patient(patient_id=patient.patient_id, reference_time=now)
-
+        results = evaluator.evaluate_batch([patient.patient_id for patient, _ in cohort], now)
+        for (patient, _), result in zip(cohort, results):
             predicted_positive = result.is_triggered
             actual_positive = patient.expected_aki
 
@@ -507,9 +501,8 @@ class TestCohortValidation:
         incorrect = 0
 
         print("\n=== Mixed Cohort Validation ===")
-        for patient, _ in cohort:
-            result = evaluator.evaluate_patient(patient_id=patient.patient_id, reference_time=now)
-
+        results = evaluator.evaluate_batch([patient.patient_id for patient, _ in cohort], now)
+        for (patient, _), result in zip(cohort, results):
             if result.is_triggered == patient.expected_aki:
                 correct += 1
                 status = "✓"
@@ -532,7 +525,7 @@ class TestCohortValidation:
 class TestEdgeCases:
     """Test clinically important edge cases."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aki_scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
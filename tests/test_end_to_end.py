@@ -5,18 +5,13 @@ Complete workflow tests from scenario parsing through evaluation and result hand
 Tests the full PSDL pipeline as it would be used in production.
 """
 
-import os
-import sys
+from datetime import datetime, timedelta
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
-from datetime import datetime, timedelta  # noqa: E402
-
-import pytest  # noqa: E402
-
-from psdl.core import PSDLParser  # noqa: E402
-from psdl.operators import DataPoint  # noqa: E402
-from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator  # noqa: E402
+from psdl.core import PSDLParser
+from psdl.operators import DataPoint
+from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator
 
 PSDLEvaluator = SinglePatientEvaluator
 
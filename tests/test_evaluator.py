@@ -4,18 +4,21 @@ Tests for PSDL Evaluator
 Run with: pytest tests/test_evaluator.py -v
 """
 
-import os
-import sys
 from datetime import datetime, timedelta
 
 import pytest
 
-# Add runtime to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-from psdl.core import PSDLParser  # noqa: E402
-from psdl.operators import DataPoint, TemporalOperators  # noqa: E402
-from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator  # noqa: E402
+from psdl.core import PSDLParser
+from psdl.operators import (
+    DataPoint,
+    DataSeries,
+    SlidingWindowAggregator,
+    TemporalOperators,
+    apply_operator,
+    apply_operators,
+    window_delta,
+)
+from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator
 
 PSDLEvaluator = SinglePatientEvaluator
 
@@ -64,6 +67,18 @@ class TestTemporalOperators:
         result = TemporalOperators.delta(sample_data, 2 * 3600, reference_time)
         assert abs(result - 0.2) < 0.01  # 1.6 - 1.4
 
+    def test_delta_skips_null_endpoints(self, reference_time):
+        data = [
+            DataPoint(reference_time - timedelta(hours=3), None),
+            DataPoint(reference_time - timedelta(hours=2), 1.0),
+            DataPoint(reference_time - timedelta(hours=1), 1.5),
+            DataPoint(reference_time, None),
+        ]
+        for series in (data, DataSeries.from_points(data)):
+            assert TemporalOperators.delta(series, 6 * 3600, reference_time) == 0.5
+            # A single non-null value has no delta
+            assert TemporalOperators.delta(series[:3], 90 * 60, reference_time) is None
+
     def test_sma(self, sample_data, reference_time):
         # Simple moving average over 3 hours
         result = TemporalOperators.sma(sample_data, 3 * 3600, reference_time)
@@ -93,6 +108,199 @@ class TestTemporalOperators:
         result = TemporalOperators.slope(flat_data, 6 * 3600, reference_time)
         assert abs(result) < 0.01
 
+    def test_data_point_has_no_instance_dict(self, reference_time):
+        dp = DataPoint(reference_time, 1.0)
+        assert not hasattr(dp, "__dict__")
+        dp.value = 2.0
+        assert dp == DataPoint(reference_time, 2.0)
+
+    def test_data_series_micros_shared_by_slices(self, reference_time):
+        series = DataSeries.from_points(
+            [DataPoint(reference_time - timedelta(hours=h), float(h)) for h in (2, 1, 0)]
+        )
+        base = (reference_time - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+        hour = 3600 * 10**6
+
+        series.ensure_micros()
+        assert series[1:]._micros == [base - hour, base]
+        assert series.micros == [base - 2 * hour, base - hour, base]
+        assert TemporalOperators.slope(series, 3 * 3600, reference_time) == pytest.approx(-1 / 3600)
+
+    def test_slope_matches_timedelta_offsets(self):
+        """Slope x values equal (timestamp - first).total_seconds(), bit for bit."""
+        start = datetime(2026, 1, 1, 12, 0, 0)
+        points = [
+            DataPoint(start + timedelta(microseconds=us), v)
+            for us, v in [(0, 1.0), (1, 2.0), (3, 2.5), (7, 4.0)]
+        ]
+
+        seconds = [(dp.timestamp - start).total_seconds() for dp in points]
+        n = len(points)
+        ys = [dp.value for dp in points]
+        sum_x, sum_y = sum(seconds), sum(ys)
+        sum_xy = sum(x * y for x, y in zip(seconds, ys))
+        sum_x2 = sum(x * x for x in seconds)
+        expected = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+
+        end = points[-1].timestamp
+        assert TemporalOperators.slope(points, 60, end) == expected
+        assert TemporalOperators.slope(DataSeries.from_points(points), 60, end) == expected
+
+    def test_data_series_window_values_shared(self, reference_time):
+        """Operators on the same series, window and reference time share one selection."""
+        from psdl.operators import _window_values
+
+        series = DataSeries.from_points(
+            [DataPoint(reference_time - timedelta(hours=h), float(h)) for h in (5, 3, 1)]
+        )
+        first = _window_values(series, 4 * 3600, reference_time)
+
+        assert first == [3.0, 1.0]
+        assert _window_values(series, 4 * 3600, reference_time) is first
+        assert _window_values(series, 6 * 3600, reference_time) == [5.0, 3.0, 1.0]
+        assert _window_values(series, 4 * 3600) is not first
+        assert TemporalOperators.percentile(series, 4 * 3600, 50, reference_time) == 2.0
+        assert first == [3.0, 1.0]
+
+    def test_percentile_matches_sorted_interpolation(self, reference_time):
+        data = [
+            DataPoint(reference_time - timedelta(minutes=m), v)
+            for m, v in ((50, 7.0), (40, None), (30, 1.0), (20, 4.0), (10, 9.0), (0, 2.0))
+        ]
+        for series in (data, DataSeries.from_points(data)):
+            for p, expected in ((0, 1.0), (25, 2.0), (50, 4.0), (90, 8.2), (100, 9.0)):
+                result = TemporalOperators.percentile(series, 3600, p, reference_time)
+                assert result == pytest.approx(expected)
+
+    def test_window_delta_memoized(self):
+        assert window_delta(3600) == timedelta(hours=1)
+        assert window_delta(3600) is window_delta(3600)
+
+    def test_data_series_matches_list(self, reference_time):
+        """Operators give identical results on a DataSeries and a DataPoint list."""
+        data = [
+            DataPoint(reference_time - timedelta(hours=h), None if h == 3 else 1.0 + 0.1 * h)
+            for h in range(8, -1, -1)
+        ]
+        series = DataSeries.from_points(data)
+
+        assert len(series) == len(data)
+        assert series[2] == data[2]
+        assert series.to_points() == data
+        for op in ["delta", "slope", "ema", "sma", "min", "max", "count", "first", "std"]:
+            assert apply_operator(op, series, 6 * 3600, reference_time) == apply_operator(
+                op, data, 6 * 3600, reference_time
+            )
+        assert TemporalOperators.last(series) == TemporalOperators.last(data)
+
+    def test_apply_operator_pointwise_ignores_window(self, sample_data, reference_time):
+        assert apply_operator("last", sample_data) == 1.6
+        assert apply_operator("last", sample_data, 3600, reference_time) == 1.6
+        assert apply_operator("exists", [], 3600, reference_time) is False
+        assert apply_operator("missing", []) is True
+        with pytest.raises(ValueError, match="requires a window"):
+            apply_operator("sma", sample_data)
+        with pytest.raises(ValueError, match="Unknown operator"):
+            apply_operator("median", sample_data, 3600, reference_time)
+
+    def test_apply_operators_matches_apply_operator(self, sample_data, reference_time):
+        """Batched operators agree with one-at-a-time application."""
+        operations = {
+            "cr_delta": ("delta", "Cr", 6 * 3600),
+            "cr_sma": ("sma", "Cr", 3 * 3600),
+            "cr_max": ("max", "Cr", 6 * 3600),
+            "cr_last": ("last", "Cr", None),
+            "lact_max": ("max", "Lact", 6 * 3600),
+        }
+        values = apply_operators(operations, {"Cr": sample_data}, reference_time)
+
+        assert list(values) == list(operations)
+        for name, (op, _, window) in list(operations.items())[:4]:
+            assert values[name] == apply_operator(op, sample_data, window, reference_time)
+        assert values["lact_max"] is None
+
+    def test_summary_matches_operators(self, sample_data, reference_time):
+        window = 6 * 3600
+        series = DataSeries.from_points(sample_data)
+        summary = TemporalOperators.summary(series, window, reference_time)
+
+        assert summary.n == 7
+        assert summary.mean == TemporalOperators.sma(sample_data, window, reference_time)
+        assert summary.min == TemporalOperators.min_val(sample_data, window, reference_time)
+        assert summary.max == TemporalOperators.max_val(sample_data, window, reference_time)
+        assert summary.std == TemporalOperators.std(sample_data, window, reference_time)
+        assert summary.last - summary.first == TemporalOperators.delta(
+            sample_data, window, reference_time
+        )
+        assert TemporalOperators.summary(series, window, reference_time) is summary
+        assert TemporalOperators.summary([], window, reference_time) is None
+
+        operations = {"mean": ("sma", "Cr", window), "sd": ("std", "Cr", window)}
+        values = apply_operators(operations, {"Cr": sample_data}, reference_time)
+        assert values == {"mean": summary.mean, "sd": summary.std}
+
+    def test_filter_by_window_bounds_inclusive(self, reference_time):
+        """Points exactly at the window start and reference time are included."""
+        data = [
+            DataPoint(reference_time - timedelta(hours=h), float(h)) for h in (7, 6, 6, 3, 0, 0)
+        ] + [DataPoint(reference_time + timedelta(hours=1), 9.0)]
+        expected = data[1:6]
+
+        assert TemporalOperators.filter_by_window(data, 6 * 3600, reference_time) == expected
+        assert (
+            TemporalOperators.filter_by_window(
+                DataSeries.from_points(data), 6 * 3600, reference_time
+            )
+            == expected
+        )
+        assert TemporalOperators.count(data, 6 * 3600, reference_time) == 5
+        assert TemporalOperators.first(data, 6 * 3600, reference_time) == 6.0
+        assert TemporalOperators.count(data, 60, reference_time - timedelta(hours=2)) == 0
+        # Reference time at or after the newest point takes the whole tail
+        for series in (data, DataSeries.from_points(data)):
+            assert TemporalOperators.count(series, 6 * 3600, data[-1].timestamp) == 4
+            assert TemporalOperators.count(series, 6 * 3600, reference_time) == 5
+
+    def test_sliding_window_aggregator_matches_operators(self, reference_time):
+        """Incremental aggregates equal the operators at every reference time."""
+        values = [1.0, 3.0, None, 2.0, 2.0, 5.0, None, 0.5, 4.0, 1.5, 3.5, None]
+        data = [
+            DataPoint(reference_time + timedelta(minutes=30 * i), v) for i, v in enumerate(values)
+        ]
+        agg = SlidingWindowAggregator(2 * 3600)
+
+        consumed = 0
+        for step in range(-2, 16):
+            ref = reference_time + timedelta(minutes=20 * step)
+            while consumed < len(data) and data[consumed].timestamp <= ref:
+                agg.push(data[consumed].timestamp, data[consumed].value)
+                consumed += 1
+            agg.advance(ref)
+
+            assert agg.count == TemporalOperators.count(data, 2 * 3600, ref)
+            assert agg.min == TemporalOperators.min_val(data, 2 * 3600, ref)
+            assert agg.max == TemporalOperators.max_val(data, 2 * 3600, ref)
+            expected_sma = TemporalOperators.sma(data, 2 * 3600, ref)
+            if expected_sma is None:
+                assert agg.sma is None
+            else:
+                assert agg.value("sma") == expected_sma
+
+        with pytest.raises(ValueError):
+            agg.value("slope")
+
+    def test_sliding_window_aggregator_sma_exact_after_eviction(self, reference_time):
+        """A large evicted value leaves no rounding error in the running sum."""
+        values = [1e16, 0.1, 0.2, 0.3, 0.1, 0.2]
+        data = [DataPoint(reference_time + timedelta(hours=i), v) for i, v in enumerate(values)]
+        agg = SlidingWindowAggregator(3 * 3600)
+
+        for dp in data:
+            agg.push(dp.timestamp, dp.value)
+            agg.advance(dp.timestamp)
+            assert agg.sma == TemporalOperators.sma(data, 3 * 3600, dp.timestamp)
+        assert agg.sma == pytest.approx(0.2)
+
 
 class TestInMemoryBackend:
     """Tests for the in-memory data backend."""
@@ -124,6 +332,16 @@ class TestInMemoryBackend:
         assert len(result) == 3
         assert result[-1].value == 2.0
 
+    def test_add_observation_keeps_time_order(self):
+        backend = InMemoryBackend()
+        base_time = datetime(2024, 1, 1, 12, 0, 0)
+
+        for hours, value in [(0, 1.0), (2, 1.2), (1, 1.1), (2, 1.3)]:
+            backend.add_observation(1, "Cr", value, base_time + timedelta(hours=hours))
+
+        # The late observation is slotted in; equal timestamps keep arrival order
+        assert [dp.value for dp in backend.data[1]["Cr"]] == [1.0, 1.1, 1.2, 1.3]
+
     def test_get_patient_ids(self):
         backend = InMemoryBackend()
         backend.add_patient(1)
@@ -317,6 +535,108 @@ logic:
         assert not results_by_id[2].is_triggered
         assert results_by_id[3].is_triggered
 
+    def test_evaluate_batch_uses_batch_fetch(self, simple_scenario_yaml, backend_with_data):
+        """Backends declaring batch_fetch are queried once per signal, not per patient."""
+        parser = PSDLParser()
+        scenario = parser.parse_string(simple_scenario_yaml)
+
+        backend, base_time = backend_with_data
+        expected = PSDLEvaluator(scenario, backend).evaluate_batch(
+            patient_ids=[1, 2, 3], reference_time=base_time
+        )
+
+        class BatchBackend(InMemoryBackend):
+            batch_calls = 0
+
+            @property
+            def capabilities(self):
+                return {"batch_fetch"}
+
+            def fetch_signal_data_batch(self, patient_ids, signal, window_seconds, reference_time):
+                BatchBackend.batch_calls += 1
+                return super().fetch_signal_data_batch(
+                    patient_ids, signal, window_seconds, reference_time
+                )
+
+        batch_backend = BatchBackend()
+        batch_backend.data = backend.data
+        results = PSDLEvaluator(scenario, batch_backend).evaluate_batch(
+            patient_ids=[1, 2, 3], reference_time=base_time
+        )
+
+        assert BatchBackend.batch_calls == len(scenario.signals)
+        assert [r.patient_id for r in results] == [1, 2, 3]
+        for batched, single in zip(results, expected):
+            assert batched.triggered_logic == single.triggered_logic
+            assert batched.trend_values == single.trend_values
+
+        parallel = PSDLEvaluator(scenario, batch_backend).evaluate_batch(
+            patient_ids=[1, 2, 3], reference_time=base_time, max_workers=2
+        )
+        assert [r.trend_values for r in parallel] == [r.trend_values for r in results]
+
+        batch_ids = []
+        batch_backend.fetch_signal_data_batch = lambda patient_ids, **kwargs: (
+            batch_ids.append(patient_ids) or {}
+        )
+        duplicated = PSDLEvaluator(scenario, batch_backend).evaluate_batch(
+            patient_ids=[3, 1, 3], reference_time=base_time
+        )
+        assert [r.patient_id for r in duplicated] == [3, 1, 3]
+        assert all(ids == [3, 1] for ids in batch_ids)
+
+    def test_evaluate_timeline_matches_pointwise(self, simple_scenario_yaml, backend_with_data):
+        """Timeline scan gives the same results as evaluating each step separately."""
+        parser = PSDLParser()
+        scenario = parser.parse_string(simple_scenario_yaml)
+
+        backend, base_time = backend_with_data
+        evaluator = PSDLEvaluator(scenario, backend)
+
+        start = base_time - timedelta(hours=8)
+        step = timedelta(hours=1)
+        timeline = evaluator.evaluate_timeline(1, start, base_time, step)
+
+        assert len(timeline) == 9
+        for i, result in enumerate(timeline):
+            expected = evaluator.evaluate(1, start + i * step)
+            assert result.timestamp == expected.timestamp
+            assert result.trend_values == expected.trend_values
+            assert result.triggered_logic == expected.triggered_logic
+        assert timeline[-1].is_triggered
+
+    def test_evaluate_timeline_incremental_trends(self, backend_with_data):
+        """Aggregator-backed trends in a timeline match pointwise evaluation."""
+        scenario = PSDLParser().parse_string("""
+scenario: Test_Timeline_Aggregates
+version: "0.3.0"
+signals:
+  Cr: creatinine
+trends:
+  cr_avg:
+    expr: sma(Cr, 4h)
+  cr_min:
+    expr: min(Cr, 4h)
+  cr_max:
+    expr: max(Cr, 12h)
+  cr_n:
+    expr: count(Cr, 4h)
+logic:
+  cr_elevated:
+    when: cr_avg > 1.2 AND cr_n >= 2
+""")
+        backend, base_time = backend_with_data
+        evaluator = PSDLEvaluator(scenario, backend)
+
+        start = base_time - timedelta(hours=10)
+        step = timedelta(minutes=90)
+        timeline = evaluator.evaluate_timeline(1, start, base_time + timedelta(hours=6), step)
+
+        for i, result in enumerate(timeline):
+            expected = evaluator.evaluate(1, start + i * step)
+            assert result.trend_values == expected.trend_values
+            assert result.triggered_logic == expected.triggered_logic
+
     def test_get_triggered_patients(self, simple_scenario_yaml, backend_with_data):
         parser = PSDLParser()
         scenario = parser.parse_string(simple_scenario_yaml)
@@ -439,6 +759,19 @@ logic:
         assert result.logic_results["stage2"] is False
         assert result.logic_results["stage3"] is True  # c_high is True
 
+    def test_logic_compiled_once(self, complex_scenario_yaml):
+        """Logic expressions are compiled once and reused across evaluations."""
+        from psdl.runtimes.single.evaluator import _compile_logic
+
+        scenario = PSDLParser().parse_string(complex_scenario_yaml)
+        stage2 = scenario.logic["stage2"]
+
+        code, variables, has_comparison = _compile_logic(stage2.expr, tuple(stage2.terms))
+        assert {term for term, _ in variables} == {"b_high", "stage1"}
+        assert not has_comparison
+        assert _compile_logic(stage2.expr, tuple(stage2.terms))[0] is code
+        assert _compile_logic("a AND (", ("a",))[0] is None
+
 
 class TestMissingData:
     """Tests for handling missing data (v0.3 syntax)."""
@@ -4,17 +4,12 @@ Tests for FHIR R4 Backend
 Tests the FHIR backend connector for PSDL using mocks.
 """
 
-import os
-import sys
+from datetime import datetime
+from unittest.mock import MagicMock, patch
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
-from datetime import datetime  # noqa: E402
-from unittest.mock import MagicMock, patch  # noqa: E402
-
-import pytest  # noqa: E402
-
-from psdl.adapters.fhir import (  # noqa: E402
+from psdl.adapters.fhir import (
     DOMAIN_RESOURCE_MAP,
     LOINC_CODES,
     REQUESTS_AVAILABLE,
@@ -23,13 +18,18 @@ from psdl.adapters.fhir import (  # noqa: E402
     FHIRResourceType,
     create_fhir_backend,
 )
-from psdl.core.ir import Domain, Signal  # noqa: E402
+from psdl.core import PSDLParser
+from psdl.core.ir import Domain, Signal
+from psdl.runtimes.single import SinglePatientEvaluator
 
 # Skip tests that require requests if not available
 requires_requests = pytest.mark.skipif(
     not REQUESTS_AVAILABLE, reason="requests library not installed"
 )
 
+# Fixed evaluation time: identical fetch parameters across tests (and runs)
+REFERENCE_TIME = datetime(2024, 1, 15, 14, 0, 0)
+
 
 class TestFHIRConfig:
     """Tests for FHIRConfig dataclass."""
@@ -132,6 +132,18 @@ class TestFHIRBackend:
         # Check that Authorization header was set
         assert "Authorization" in mock_session.headers
 
+    @requires_requests
+    def test_session_retries_transient_errors(self, config):
+        """The session retries throttled and 5xx searches with backoff."""
+        config.max_retries = 2
+        backend = FHIRBackend(config)
+        retry = backend._get_session().get_adapter(config.base_url).max_retries
+
+        assert retry.total == 2
+        assert 429 in retry.status_forcelist
+        assert retry.backoff_factor > 0
+        backend.close()
+
     def test_get_loinc_code_from_mappings(self, config):
         """Test LOINC code lookup from config mappings."""
         config.loinc_mappings = {"custom_signal": "99999-9"}
@@ -168,6 +180,16 @@ class TestFHIRBackend:
         code = backend._get_loinc_code(signal)
         assert code == "12345-6"
 
+    def test_get_loinc_code_memoized(self, backend):
+        """The mapping lookup runs once per signal, not once per fetch."""
+        backend.mapping = MagicMock()
+        backend.mapping.get_loinc_code.return_value = "2160-0"
+        signal = Signal(name="Cr", ref="creatinine", domain=Domain.MEASUREMENT)
+
+        assert backend._get_loinc_code(signal) == "2160-0"
+        assert backend._get_loinc_code(signal) == "2160-0"
+        assert backend.mapping.get_loinc_code.call_count == 1
+
     def test_parse_datetime_iso(self, backend):
         """Test parsing ISO datetime strings."""
         dt = backend._parse_datetime("2024-01-15T10:30:00Z")
@@ -186,6 +208,19 @@ class TestFHIRBackend:
         assert dt.month == 1
         assert dt.day == 15
 
+    def test_parse_datetime_utc_and_offsets(self, backend):
+        """UTC suffixes give naive datetimes; other offsets stay timezone-aware."""
+        expected = datetime(2024, 1, 15, 10, 30, 0, 250000)
+        assert backend._parse_datetime("2024-01-15T10:30:00.25Z") == expected
+        assert backend._parse_datetime("2024-01-15T10:30:00.25+00:00") == expected
+        assert backend._parse_datetime("2024-01-15T10:30:00") == expected.replace(microsecond=0)
+
+        dt = backend._parse_datetime("2024-01-15T10:30:00-05:00")
+        assert dt.utcoffset().total_seconds() == -5 * 3600
+
+        # Out-of-range fields are rejected, not wrapped
+        assert backend._parse_datetime("2024-02-30T10:30:00Z") is None
+
     def test_parse_datetime_invalid(self, backend):
         """Test parsing invalid datetime."""
         dt = backend._parse_datetime("not-a-date")
@@ -336,11 +371,205 @@ class TestFHIRBackend:
             patient_id="patient-123",
             signal=signal,
             window_seconds=86400,
-            reference_time=datetime.now(),
+            reference_time=REFERENCE_TIME,
         )
 
         assert len(data_points) == 0
 
+    @requires_requests
+    @patch("psdl.adapters.fhir.requests")
+    def test_fetch_patient_signals_single_search(self, mock_requests, backend):
+        """Observation signals for one patient share a single coded search."""
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+
+        def observation(code, value, hour):
+            return {
+                "resource": {
+                    "resourceType": "Observation",
+                    "code": {"coding": [{"system": "http://loinc.org", "code": code}]},
+                    "effectiveDateTime": f"2024-01-15T{hour:02d}:00:00Z",
+                    "valueQuantity": {"value": value},
+                }
+            }
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "resourceType": "Bundle",
+            "entry": [
+                observation("2160-0", 1.5, 12),
+                observation("2524-7", 3.1, 11),
+                observation("2160-0", 1.2, 10),
+            ],
+        }
+        mock_session.get.return_value = mock_response
+
+        signals = {
+            "Cr": Signal(name="Cr", ref="creatinine", domain=Domain.MEASUREMENT),
+            "Lact": Signal(name="Lact", ref="lactate", domain=Domain.MEASUREMENT),
+        }
+        data = backend.fetch_patient_signals(
+            patient_id="patient-123",
+            signals=signals,
+            window_seconds=86400,
+            reference_time=REFERENCE_TIME,
+        )
+
+        assert mock_session.get.call_count == 1
+        params = mock_session.get.call_args[1]["params"]
+        assert params["code"] == "http://loinc.org|2160-0,http://loinc.org|2524-7"
+        assert [dp.value for dp in data["Cr"]] == [1.2, 1.5]
+        assert [dp.value for dp in data["Lact"]] == [3.1]
+
+    @requires_requests
+    @patch("psdl.adapters.fhir.requests")
+    def test_fetch_patient_signals_follows_next_links(self, mock_requests, backend):
+        """The combined search reads every result page."""
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+
+        def observation(code, value, hour):
+            return {
+                "resource": {
+                    "resourceType": "Observation",
+                    "code": {"coding": [{"system": "http://loinc.org", "code": code}]},
+                    "effectiveDateTime": f"2024-01-15T{hour:02d}:00:00Z",
+                    "valueQuantity": {"value": value},
+                }
+            }
+
+        first_page = MagicMock()
+        first_page.json.return_value = {
+            "resourceType": "Bundle",
+            "entry": [observation("2160-0", 1.2, 10)],
+            "link": [{"relation": "next", "url": "http://fhir.test/Observation?page=2"}],
+        }
+        second_page = MagicMock()
+        second_page.json.return_value = {
+            "resourceType": "Bundle",
+            "entry": [observation("2160-0", 1.5, 12), observation("2524-7", 3.1, 11)],
+        }
+        mock_session.get.side_effect = [first_page, second_page]
+
+        signals = {
+            "Cr": Signal(name="Cr", ref="creatinine", domain=Domain.MEASUREMENT),
+            "Lact": Signal(name="Lact", ref="lactate", domain=Domain.MEASUREMENT),
+        }
+        data = backend.fetch_patient_signals("patient-123", signals, 86400, REFERENCE_TIME)
+
+        assert mock_session.get.call_count == 2
+        assert mock_session.get.call_args[0][0] == "http://fhir.test/Observation?page=2"
+        assert [dp.value for dp in data["Cr"]] == [1.2, 1.5]
+        assert [dp.value for dp in data["Lact"]] == [3.1]
+
+    @requires_requests
+    @patch("psdl.adapters.fhir.requests")
+    def test_fetch_patient_signals_falls_back_per_signal(self, mock_requests, backend):
+        """A combined search that does not return a Bundle is retried per signal."""
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+
+        outcome = MagicMock()
+        outcome.json.return_value = {"resourceType": "OperationOutcome"}
+        per_signal = MagicMock()
+        per_signal.json.return_value = {
+            "resourceType": "Bundle",
+            "entry": [
+                {
+                    "resource": {
+                        "resourceType": "Observation",
+                        "effectiveDateTime": "2024-01-15T10:00:00Z",
+                        "valueQuantity": {"value": 1.2},
+                    }
+                }
+            ],
+        }
+        mock_session.get.side_effect = [outcome, per_signal, per_signal]
+
+        signals = {
+            "Cr": Signal(name="Cr", ref="creatinine", domain=Domain.MEASUREMENT),
+            "Lact": Signal(name="Lact", ref="lactate", domain=Domain.MEASUREMENT),
+        }
+        data = backend.fetch_patient_signals("patient-123", signals, 86400, REFERENCE_TIME)
+
+        assert mock_session.get.call_count == 3
+        assert [dp.value for dp in data["Cr"]] == [1.2]
+        assert [dp.value for dp in data["Lact"]] == [1.2]
+
+    @requires_requests
+    @patch("psdl.adapters.fhir.requests")
+    def test_fetch_signal_data_batch_concurrent(self, mock_requests, backend):
+        """Batch fetch searches every patient and keys results by patient ID."""
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+
+        def search(url, params=None, timeout=None):
+            response = MagicMock()
+            response.json.return_value = {
+                "resourceType": "Bundle",
+                "entry": [
+                    {
+                        "resource": {
+                            "resourceType": "Observation",
+                            "effectiveDateTime": "2024-01-15T10:00:00Z",
+                            "valueQuantity": {"value": float(params["patient"][-1])},
+                        }
+                    }
+                ],
+            }
+            return response
+
+        mock_session.get.side_effect = search
+        signal = Signal(name="Cr", ref="creatinine", domain=Domain.MEASUREMENT)
+        patient_ids = [f"patient-{i}" for i in range(5)]
+
+        batch = backend.fetch_signal_data_batch(
+            patient_ids=patient_ids,
+            signal=signal,
+            window_seconds=86400,
+            reference_time=datetime(2024, 1, 15, 14, 0, 0),
+        )
+
+        assert list(batch) == patient_ids
+        assert [points[0].value for points in batch.values()] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert mock_session.get.call_count == 5
+
+    @requires_requests
+    @patch("psdl.adapters.fhir.requests")
+    def test_evaluate_batch_one_search_per_patient(self, mock_requests, backend):
+        """A multi-signal cohort costs one combined search per patient, not per signal."""
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"resourceType": "Bundle", "entry": []}
+        mock_session.get.return_value = mock_response
+
+        scenario = PSDLParser().parse_string("""
+scenario: FHIR_Batch
+version: "0.3.0"
+signals:
+  Cr:
+    ref: creatinine
+  Lact:
+    ref: lactate
+trends:
+  cr_last:
+    expr: last(Cr)
+  lact_last:
+    expr: last(Lact)
+logic:
+  high:
+    when: cr_last > 1.8 OR lact_last > 2
+""")
+        patient_ids = ["patient-1", "patient-2", "patient-3"]
+        results = SinglePatientEvaluator(scenario, backend).evaluate_batch(
+            patient_ids, REFERENCE_TIME
+        )
+
+        assert "batch_fetch" not in backend.capabilities
+        assert [r.patient_id for r in results] == patient_ids
+        assert mock_session.get.call_count == len(patient_ids)
+
     @requires_requests
     @patch("psdl.adapters.fhir.requests")
     def test_fetch_signal_data_request_error(self, mock_requests, backend):
@@ -359,7 +588,7 @@ class TestFHIRBackend:
             patient_id="patient-123",
             signal=signal,
             window_seconds=86400,
-            reference_time=datetime.now(),
+            reference_time=REFERENCE_TIME,
         )
 
         # Should return empty list on error
@@ -390,6 +619,10 @@ class TestFHIRBackend:
         assert "patient-1" in patient_ids
         assert "patient-2" in patient_ids
 
+        # One id-only page of config.page_size patients per request
+        url = mock_session.get.call_args[0][0]
+        assert url.endswith("Patient?_elements=id&_count=1000")
+
     @requires_requests
     @patch("psdl.adapters.fhir.requests")
     def test_get_patient(self, mock_requests, backend):
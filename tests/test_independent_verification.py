@@ -13,12 +13,8 @@ Each test case includes:
 If PSDL matches manual calculations, the implementation is correct.
 """
 
-import os
-import sys
 from datetime import datetime, timedelta
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 import pytest
 
 from psdl.core import PSDLParser
@@ -188,7 +184,7 @@ class TestManualSlopeVerification:
 class TestManualAKITriggerVerification:
     """Verify complete AKI scenario against manual logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aki_scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
@@ -427,7 +423,7 @@ class TestClinicalReferenceCases:
     These verify PSDL against real-world clinical expectations.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aki_scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
@@ -7,33 +7,46 @@ For integration tests with a real OMOP database, see tests/integration/
 Run with: pytest tests/test_omop_backend.py -v
 """
 
-import os
-import sys
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 
-# Add runtime to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from psdl.adapters.omop import OMOPBackend, OMOPConfig, create_omop_backend
+from psdl.core import PSDLParser
+from psdl.core.ir import Domain, Signal
+from psdl.runtimes.cohort import CompiledSQL
+from psdl.runtimes.single import SinglePatientEvaluator
 
-from psdl.adapters.omop import OMOPBackend, OMOPConfig, create_omop_backend  # noqa: E402
-from psdl.core.ir import Domain, Signal  # noqa: E402
+try:
+    from sqlalchemy import text
+except ImportError:  # optional extra; tests that build queries need it
+    text = None
+
+requires_sqlalchemy = pytest.mark.skipif(text is None, reason="sqlalchemy not installed")
+
+# Mocked tests never connect; the URL only selects PostgreSQL engine options
+CONNECTION_STRING = "postgresql://localhost/test"
+
+# Fixed reference time so queries bind the same parameters on every run
+REFERENCE_TIME = datetime(2024, 1, 15, 12, 0, 0)
 
 
 class TestOMOPConfig:
     """Tests for OMOP configuration."""
 
     def test_default_config(self):
-        config = OMOPConfig(connection_string="postgresql://localhost/test")
+        config = OMOPConfig(connection_string=CONNECTION_STRING)
         assert config.cdm_schema == "cdm"
         assert config.vocab_schema == "cdm"
         assert config.cdm_version == "5.4"
         assert config.use_datetime is True
+        assert config.pool_size == 25
+        assert config.pool_pre_ping is True
 
     def test_custom_config(self):
         config = OMOPConfig(
-            connection_string="postgresql://localhost/test",
+            connection_string=CONNECTION_STRING,
             cdm_schema="omop",
             vocab_schema="vocab",
             cdm_version="5.3",
@@ -46,14 +59,14 @@ class TestOMOPConfig:
     def test_invalid_version(self):
         with pytest.raises(ValueError) as exc_info:
             OMOPConfig(
-                connection_string="postgresql://localhost/test",
+                connection_string=CONNECTION_STRING,
                 cdm_version="6.0",
             )
         assert "Unsupported CDM version" in str(exc_info.value)
 
     def test_concept_mappings(self):
         config = OMOPConfig(
-            connection_string="postgresql://localhost/test",
+            connection_string=CONNECTION_STRING,
             concept_mappings={"Cr": 3016723, "Lact": 3047181},
         )
         assert config.concept_mappings["Cr"] == 3016723
@@ -65,7 +78,7 @@ class TestOMOPBackend:
     @pytest.fixture
     def config(self):
         return OMOPConfig(
-            connection_string="postgresql://localhost/test",
+            connection_string=CONNECTION_STRING,
             cdm_schema="cdm",
         )
 
@@ -95,35 +108,85 @@ class TestOMOPBackend:
         concept_id = backend._get_concept_id(signal)
         assert concept_id == 12345
 
+    def test_get_concept_id_cached(self, backend, creatinine_signal):
+        with patch.object(OMOPBackend, "_resolve_concept_id", return_value=3016723) as mock_resolve:
+            assert backend._get_concept_id(creatinine_signal) == 3016723
+            assert backend._get_concept_id(creatinine_signal) == 3016723
+        mock_resolve.assert_called_once()
+
+    def test_get_concept_id_sees_config_changes(self, backend, creatinine_signal):
+        assert backend._get_concept_id(creatinine_signal) == 3016723
+        backend.config.concept_mappings["Cr"] = 99999
+        assert backend._get_concept_id(creatinine_signal) == 99999
+
     def test_get_concept_id_missing(self, backend):
         signal = Signal(name="Unknown", ref="unknown", concept_id=None)
         with pytest.raises(ValueError) as exc_info:
             backend._get_concept_id(signal)
         assert "No concept_id found" in str(exc_info.value)
 
-    def test_get_table_name(self, backend):
-        assert backend._get_table_name("measurement") == "cdm.measurement"
-        assert backend._get_table_name("observation") == "cdm.observation"
-        assert backend._get_table_name("condition") == "cdm.condition_occurrence"
-
-    def test_get_datetime_column(self, backend):
-        assert backend._get_datetime_column("measurement") == "measurement_datetime"
-        assert backend._get_datetime_column("observation") == "observation_datetime"
-        assert backend._get_datetime_column("condition") == "condition_start_datetime"
+    def test_engine_options_pool(self, backend):
+        options = backend._engine_options()
+        assert options["pool_size"] == 25
+        assert options["max_overflow"] == 25
+        assert options["pool_recycle"] == 1800
+
+    def test_engine_options_sqlite(self):
+        backend = OMOPBackend(OMOPConfig(connection_string="sqlite://"))
+        assert backend._engine_options() == {}
+
+    @requires_sqlalchemy
+    def test_execute_query_streams_rows(self):
+        backend = OMOPBackend(OMOPConfig(connection_string="sqlite://"))
+        rows = backend._execute_query("SELECT 1 AS a UNION ALL SELECT 2 AS a", {})
+
+        assert not isinstance(rows, list)
+        assert [row.a for row in rows] == [1, 2]
+        rows = backend._execute_query("SELECT 1 AS a UNION ALL SELECT 2 AS a", {}, stream=False)
+        assert [row.a for row in rows] == [1, 2]
+        backend.close()
+
+    @pytest.mark.parametrize(
+        "domain,expected",
+        [
+            ("measurement", "cdm.measurement"),
+            ("observation", "cdm.observation"),
+            ("condition", "cdm.condition_occurrence"),
+        ],
+    )
+    def test_get_table_name(self, backend, domain, expected):
+        assert backend._get_table_name(domain) == expected
+
+    @pytest.mark.parametrize(
+        "domain,expected",
+        [
+            ("measurement", "measurement_datetime"),
+            ("observation", "observation_datetime"),
+            ("condition", "condition_start_datetime"),
+        ],
+    )
+    def test_get_datetime_column(self, backend, domain, expected):
+        assert backend._get_datetime_column(domain) == expected
 
     def test_get_datetime_column_date_mode(self, config):
         config.use_datetime = False
         backend = OMOPBackend(config)
         assert backend._get_datetime_column("measurement") == "measurement_date"
+        assert backend._get_datetime_column("drug") == "drug_exposure_start_date"
 
+    def test_get_value_column(self, backend):
+        assert backend._get_value_column("observation") == "value_as_number"
+        assert backend._get_value_column("condition") == "1.0"
+
+    @requires_sqlalchemy
     @patch.object(OMOPBackend, "_execute_query")
     def test_fetch_signal_data(self, mock_query, backend, creatinine_signal):
         """Test fetching measurement data."""
-        now = datetime(2024, 1, 15, 12, 0, 0)
+        now = REFERENCE_TIME
         mock_query.return_value = [
-            {"event_datetime": now - timedelta(hours=6), "value": 1.0},
-            {"event_datetime": now - timedelta(hours=3), "value": 1.2},
-            {"event_datetime": now, "value": 1.5},
+            (now - timedelta(hours=6), 1.0),
+            (now - timedelta(hours=3), 1.2),
+            (now, 1.5),
         ]
 
         data = backend.fetch_signal_data(
@@ -138,6 +201,7 @@ class TestOMOPBackend:
         assert data[2].value == 1.5
         mock_query.assert_called_once()
 
+    @requires_sqlalchemy
     @patch.object(OMOPBackend, "_execute_query")
     def test_fetch_signal_data_empty(self, mock_query, backend, creatinine_signal):
         """Test fetching when no data exists."""
@@ -147,31 +211,61 @@ class TestOMOPBackend:
             patient_id=12345,
             signal=creatinine_signal,
             window_seconds=24 * 3600,
-            reference_time=datetime.now(),
+            reference_time=REFERENCE_TIME,
         )
 
         assert len(data) == 0
 
+    @requires_sqlalchemy
     @patch.object(OMOPBackend, "_execute_query")
-    def test_get_patient_ids(self, mock_query, backend):
-        """Test retrieving patient IDs."""
+    def test_fetch_signal_data_batch(self, mock_query, backend, creatinine_signal):
+        """Test fetching a signal for several patients in one query."""
+        now = REFERENCE_TIME
         mock_query.return_value = [
-            {"person_id": 1},
-            {"person_id": 2},
-            {"person_id": 3},
+            (1, now - timedelta(hours=6), 1.0),
+            (1, now, 1.5),
+            (2, now, 0.9),
         ]
 
+        data = backend.fetch_signal_data_batch(
+            patient_ids=[1, 2, 3],
+            signal=creatinine_signal,
+            window_seconds=24 * 3600,
+            reference_time=now,
+        )
+
+        assert [dp.value for dp in data[1]] == [1.0, 1.5]
+        assert [dp.value for dp in data[2]] == [0.9]
+        assert data[3] == []
+        mock_query.assert_called_once()
+        query, params = mock_query.call_args[0]
+        assert "IN :person_ids" in query.text
+        assert params["person_ids"] == [1, 2, 3]
+
+    @requires_sqlalchemy
+    def test_signal_query_cached(self, backend, creatinine_signal):
+        """The same SQL statement object is reused across patients."""
+        first, params = backend._build_signal_query(creatinine_signal)
+        second, _ = backend._build_signal_query(creatinine_signal)
+        batch, _ = backend._build_signal_query(creatinine_signal, batch=True)
+
+        assert first is second
+        assert batch is not first
+        assert params == {"match_value": 3016723}
+
+    @patch.object(OMOPBackend, "_execute_scalars")
+    def test_get_patient_ids(self, mock_query, backend):
+        """Test retrieving patient IDs."""
+        mock_query.return_value = [1, 2, 3]
+
         patient_ids = backend.get_patient_ids()
 
         assert patient_ids == [1, 2, 3]
 
-    @patch.object(OMOPBackend, "_execute_query")
+    @patch.object(OMOPBackend, "_execute_scalars")
     def test_get_patient_ids_with_signal(self, mock_query, backend, creatinine_signal):
         """Test finding patients with specific signal data."""
-        mock_query.return_value = [
-            {"person_id": 1, "obs_count": 5},
-            {"person_id": 3, "obs_count": 10},
-        ]
+        mock_query.return_value = [1, 3]
 
         patient_ids = backend.get_patient_ids_with_signal(creatinine_signal, min_observations=3)
 
@@ -184,7 +278,7 @@ class TestPopulationFiltering:
     @pytest.fixture
     def config(self):
         return OMOPConfig(
-            connection_string="postgresql://localhost/test",
+            connection_string=CONNECTION_STRING,
             cdm_schema="cdm",
         )
 
@@ -286,10 +380,10 @@ class TestPopulationFiltering:
         assert sql is None
         assert idx == 0
 
-    @patch.object(OMOPBackend, "_execute_query")
+    @patch.object(OMOPBackend, "_execute_scalars")
     def test_get_patient_ids_with_include_filters(self, mock_query, backend):
         """Test get_patient_ids with inclusion criteria."""
-        mock_query.return_value = [{"person_id": 1}, {"person_id": 2}]
+        mock_query.return_value = [1, 2]
 
         patient_ids = backend.get_patient_ids(population_include=["age >= 18", "gender == 'M'"])
 
@@ -300,10 +394,10 @@ class TestPopulationFiltering:
         assert "WHERE" in query
         assert "AND" in query
 
-    @patch.object(OMOPBackend, "_execute_query")
+    @patch.object(OMOPBackend, "_execute_scalars")
     def test_get_patient_ids_with_exclude_filters(self, mock_query, backend):
         """Test get_patient_ids with exclusion criteria."""
-        mock_query.return_value = [{"person_id": 1}]
+        mock_query.return_value = [1]
 
         patient_ids = backend.get_patient_ids(
             population_exclude=["has_condition(201826)"]
@@ -314,10 +408,10 @@ class TestPopulationFiltering:
         query = call_args[0][0]
         assert "NOT" in query
 
-    @patch.object(OMOPBackend, "_execute_query")
+    @patch.object(OMOPBackend, "_execute_scalars")
     def test_get_patient_ids_with_include_and_exclude(self, mock_query, backend):
         """Test get_patient_ids with both include and exclude criteria."""
-        mock_query.return_value = [{"person_id": 1}]
+        mock_query.return_value = [1]
 
         patient_ids = backend.get_patient_ids(
             population_include=["age >= 18", "has_measurement(3016723)"],
@@ -331,10 +425,10 @@ class TestPopulationFiltering:
         assert "WHERE" in query
         assert "NOT" in query
 
-    @patch.object(OMOPBackend, "_execute_query")
+    @patch.object(OMOPBackend, "_execute_scalars")
     def test_get_patient_ids_no_filters(self, mock_query, backend):
         """Test get_patient_ids without any filters returns all patients."""
-        mock_query.return_value = [{"person_id": i} for i in range(1, 6)]
+        mock_query.return_value = list(range(1, 6))
 
         patient_ids = backend.get_patient_ids()
 
@@ -345,12 +439,169 @@ class TestPopulationFiltering:
         assert "WHERE" not in query or query.count("WHERE") == 0
 
 
+@requires_sqlalchemy
+class TestSignalQueries:
+    """Round-trip signal queries against a small SQLite CDM."""
+
+    @pytest.fixture(scope="class")
+    def backend(self, tmp_path_factory):
+        """One CDM and engine (with its connection pool) for the whole class."""
+        cdm_path = tmp_path_factory.mktemp("omop") / "cdm.db"
+        config = OMOPConfig(
+            connection_string=f"sqlite:///{cdm_path}",
+            cdm_schema="main",
+            concept_mappings={"Cr": 3016723},
+        )
+        backend = OMOPBackend(config)
+
+        with backend._get_engine().begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE measurement (person_id INTEGER, measurement_concept_id INTEGER, "
+                    "measurement_datetime TEXT, value_as_number NUMERIC)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO measurement VALUES "
+                    "(1, 3016723, '2024-01-15 06:00:00', 1), "
+                    "(1, 3016723, '2024-01-15 09:00:00', NULL), "
+                    "(1, 3016723, '2024-01-15 12:00:00', 2), "
+                    "(2, 3016723, '2024-01-15 10:00:00', 1.5), "
+                    "(2, 9999999, '2024-01-15 10:00:00', 7)"
+                )
+            )
+        yield backend
+        backend.close()
+
+    @pytest.fixture(scope="class")
+    def scenario(self):
+        return PSDLParser().parse_string("""
+scenario: OMOP_Batch
+version: "0.3.0"
+signals:
+  Cr:
+    ref: creatinine
+trends:
+  cr_last:
+    expr: last(Cr)
+logic:
+  cr_high:
+    when: cr_last > 1.8
+""")
+
+    def test_fetch_signal_data_values_are_floats(self, backend):
+        signal = Signal(name="Cr", ref="creatinine")
+        data = backend.fetch_signal_data(1, signal, 24 * 3600, REFERENCE_TIME)
+
+        assert [dp.value for dp in data] == [1.0, 2.0]
+        assert all(isinstance(dp.value, float) for dp in data)
+
+    def test_fetch_signal_data_batch_roundtrip(self, backend):
+        signal = Signal(name="Cr", ref="creatinine")
+        data = backend.fetch_signal_data_batch([1, 2, 3], signal, 24 * 3600, REFERENCE_TIME)
+
+        assert [dp.value for dp in data[1]] == [1.0, 2.0]
+        assert [dp.value for dp in data[2]] == [1.5]
+        assert data[3] == []
+
+        by_str = backend.fetch_signal_data_batch(["1", "3"], signal, 24 * 3600, REFERENCE_TIME)
+        assert list(by_str) == ["1", "3"]
+        assert [dp.value for dp in by_str["1"]] == [1.0, 2.0]
+        assert by_str["3"] == []
+
+    def test_get_patient_ids_with_signal_roundtrip(self, backend):
+        signal = Signal(name="Cr", ref="creatinine")
+
+        assert backend.get_patient_ids_with_signal(signal) == [1, 2]
+        assert backend.get_patient_ids_with_signal(signal, min_observations=2) == [1]
+
+    def test_evaluate_batch_one_query_per_signal(self, backend, scenario):
+        evaluator = SinglePatientEvaluator(scenario, backend)
+
+        with patch.object(backend, "_execute_query", wraps=backend._execute_query) as spy:
+            results = evaluator.evaluate_batch([1, 2, 3], REFERENCE_TIME)
+
+        assert spy.call_count == len(scenario.signals)
+        assert [r.patient_id for r in results] == [1, 2, 3]
+        assert [r.is_triggered for r in results] == [True, False, False]
+
+    def test_index_ddl(self, backend):
+        assert backend.index_ddl() == (
+            "CREATE INDEX idx_psdl_measurement ON main.measurement "
+            "(person_id, measurement_concept_id, measurement_datetime)"
+        )
+
+    def test_index_ddl_matches_query_columns(self, backend):
+        backend.config.use_source_values = True
+        try:
+            assert backend.index_ddl("condition") == (
+                "CREATE INDEX idx_psdl_condition_occurrence ON main.condition_occurrence "
+                "(person_id, condition_source_value, condition_start_datetime)"
+            )
+        finally:
+            backend.config.use_source_values = False
+
+    def test_check_indexes(self, backend):
+        with pytest.warns(UserWarning, match="No index on measurement"):
+            assert backend.check_indexes() == [backend.index_ddl()]
+
+        with backend._get_engine().begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE INDEX idx_meas ON measurement "
+                    "(measurement_concept_id, person_id, measurement_datetime)"
+                )
+            )
+        try:
+            assert backend.check_indexes() == []
+        finally:
+            with backend._get_engine().begin() as conn:
+                conn.execute(text("DROP INDEX idx_meas"))
+
+
+@requires_sqlalchemy
+class TestCohortScreening:
+    """Tests for in-database cohort screening."""
+
+    @pytest.fixture(scope="class")
+    def backend(self, tmp_path_factory):
+        cdm_path = tmp_path_factory.mktemp("omop") / "cdm.db"
+        config = OMOPConfig(connection_string=f"sqlite:///{cdm_path}", cdm_schema="main")
+        backend = OMOPBackend(config)
+
+        with backend._get_engine().begin() as conn:
+            conn.execute(text("CREATE TABLE screen (person_id INTEGER, cr REAL, alert INTEGER)"))
+            conn.execute(
+                text("INSERT INTO screen VALUES (1, 2.1, 1), (2, 0.9, 0), (3, 1.8, 1), (4, 0.8, 0)")
+            )
+        yield backend
+        backend.close()
+
+    @pytest.fixture(scope="class")
+    def compiled(self):
+        return CompiledSQL(
+            sql="SELECT person_id, cr, alert FROM screen",
+            parameters={"reference_time": "NOW()"},
+            trend_columns=["cr"],
+            logic_columns=["alert"],
+        )
+
+    def test_screen_cohort(self, backend, compiled):
+        with patch.object(OMOPBackend, "compile", return_value=compiled):
+            assert backend.screen_cohort(scenario=None) == ["1", "3"]
+
+    def test_screen_cohort_patient_filter(self, backend, compiled):
+        with patch.object(OMOPBackend, "compile", return_value=compiled):
+            assert backend.screen_cohort(scenario=None, patient_ids=[2, 3]) == ["3"]
+
+
 class TestCreateOMOPBackend:
     """Tests for convenience function."""
 
     def test_create_backend(self):
         backend = create_omop_backend(
-            connection_string="postgresql://localhost/test",
+            connection_string=CONNECTION_STRING,
             cdm_schema="public",
             cdm_version="5.4",
         )
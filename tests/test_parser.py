@@ -36,6 +36,16 @@ class TestWindowSpec:
         ws = WindowSpec(6, "h")
         assert str(ws) == "6h"
 
+    def test_parse_window_returns_fresh_spec(self):
+        parser = PSDLParser()
+        first = parser._parse_window("6h")
+        second = parser._parse_window("6h")
+
+        assert first == second == WindowSpec(6, "h")
+        assert first is not second
+        with pytest.raises(PSDLParseError):
+            parser._parse_window("6 hours")
+
 
 class TestPSDLParserBasic:
     """Basic parser tests."""
@@ -160,6 +170,7 @@ logic:
         assert lact.concept_id == 3047181
         assert lact.unit == "mmol/L"
         assert lact.domain == Domain.MEASUREMENT
+        assert lact.domain_str == "measurement"
 
 
 class TestTrendParsing:
@@ -365,6 +376,14 @@ logic:
         assert "b_value" in logic.terms
         assert "c_value" in logic.terms
 
+    def test_logic_expr_terms_and_operators(self):
+        """Operator keywords are split from terms, including terms that start with one."""
+        terms, operators = PSDLParser()._parse_logic_expr(
+            "x", "(android_flag AND NOT order_ok) or cr_value >= 0.3 OR 1h_count == True"
+        )
+        assert terms == ["android_flag", "order_ok", "cr_value"]
+        assert operators == ["AND", "NOT", "OR", "OR"]
+
 
 class TestPopulationParsing:
     """Tests for population filter parsing."""
@@ -500,6 +519,18 @@ class TestExampleScenarios:
         for filepath in yamls:
             PSDLParser().parse_file(str(filepath))
 
+    def test_parse_file_matches_parse_string(self, examples_dir):
+        filepath = examples_dir / "aki_detection.yaml"
+        from_file = PSDLParser().parse_file(str(filepath))
+        from_string = PSDLParser().parse_string(filepath.read_text(), source=str(filepath))
+        assert from_file == from_string
+
+    def test_parse_file_invalid_yaml(self, tmp_path):
+        filepath = tmp_path / "broken.yaml"
+        filepath.write_text("scenario: [unclosed\n")
+        with pytest.raises(PSDLParseError, match="Invalid YAML"):
+            PSDLParser().parse_file(str(filepath))
+
 
 class TestStrictMode:
     """Tests for opt-in strict JSON Schema validation (#7)."""
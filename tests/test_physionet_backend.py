@@ -0,0 +1,82 @@
+"""
+Tests for PhysioNet Challenge 2019 Backend
+
+Loads small .psv files written to a temporary directory.
+
+Run with: pytest tests/test_physionet_backend.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+
+from psdl.adapters.physionet import PhysioNetBackend
+from psdl.core.ir import Signal
+
+PSV_ROWS = [
+    "HR|Creatinine|Lactate|ICULOS|SepsisLabel",
+    "80|1.0|NaN|1|0",
+    "85|NaN|NaN|2|0",
+    "92|1.4||3|1",
+    "101|1.9|3.2|4|1",
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "p000001.psv").write_text("\n".join(PSV_ROWS) + "\n")
+    return tmp_path
+
+
+@pytest.fixture
+def backend(data_dir):
+    return PhysioNetBackend(data_dir)
+
+
+class TestLoadPatient:
+    """Tests for .psv parsing."""
+
+    def test_load_values(self, backend):
+        assert backend.load_patient("p000001")
+
+        hr = backend.get_signal_data("HR", "p000001")
+        assert [dp.value for dp in hr] == [80.0, 85.0, 92.0, 101.0]
+        assert hr[0].timestamp == datetime(2024, 1, 1, 1)
+
+        # NaN and empty cells are skipped
+        creatinine = backend.get_signal_data("Creatinine", "p000001")
+        assert [dp.value for dp in creatinine] == [1.0, 1.4, 1.9]
+        assert [dp.value for dp in backend.get_signal_data("Lactate", "p000001")] == [3.2]
+
+        # The stored columns are internal; callers get a list of their own
+        assert isinstance(hr, list)
+
+    def test_metadata(self, backend):
+        backend.load_patient("000001")
+
+        meta = backend.get_patient_metadata("p000001")
+        assert meta["has_sepsis"]
+        assert meta["sepsis_onset_hour"] == 3
+        assert meta["total_hours"] == 4
+
+    def test_missing_and_empty_files(self, backend, data_dir):
+        (data_dir / "p000002.psv").write_text("")
+
+        assert not backend.load_patient("p000009")
+        assert not backend.load_patient("p000002")
+
+    def test_fetch_signal_data_window(self, backend):
+        signal = Signal(name="Cr", ref="Creatinine")
+
+        data = backend.fetch_signal_data("p000001", signal, 2 * 3600, datetime(2024, 1, 1, 4))
+
+        assert [dp.value for dp in data] == [1.4, 1.9]
+        assert isinstance(data, list)
+
+    def test_fetch_signal_data_unprefixed_id(self, backend):
+        signal = Signal(name="HR", ref="HR")
+
+        data = backend.fetch_signal_data("000001", signal, 24 * 3600, datetime(2024, 1, 1, 4))
+
+        assert [dp.value for dp in data] == [80.0, 85.0, 92.0, 101.0]
+        assert list(backend.get_patient_ids()) == ["p000001"]
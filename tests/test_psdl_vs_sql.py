@@ -10,13 +10,9 @@ If PSDL results match SQL results, we can be confident that:
 3. The logic engine correctly combines conditions
 """
 
-import os
-import sys
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Tuple
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 import pytest
 
 from psdl.core import PSDLParser
@@ -190,13 +186,13 @@ class SQLEmulator:
 class TestPSDLvsSQLEquivalence:
     """Test that PSDL produces identical results to pure SQL logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aki_scenario(self):
         """Load AKI detection scenario."""
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def icu_scenario(self):
         """Load ICU deterioration scenario."""
         parser = PSDLParser()
@@ -414,7 +410,7 @@ class TestPSDLvsSQLEquivalence:
 class TestBatchComparison:
     """Run batch comparisons to validate PSDL accuracy."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aki_scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
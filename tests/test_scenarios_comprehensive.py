@@ -5,18 +5,13 @@ Tests all example scenarios with various data patterns to ensure
 correct evaluation under different clinical conditions.
 """
 
-import os
-import sys
+from datetime import datetime, timedelta
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
-from datetime import datetime, timedelta  # noqa: E402
-
-import pytest  # noqa: E402
-
-from psdl.core import PSDLParser  # noqa: E402
-from psdl.operators import DataPoint  # noqa: E402
-from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator  # noqa: E402
+from psdl.core import PSDLParser
+from psdl.operators import DataPoint
+from psdl.runtimes.single import InMemoryBackend, SinglePatientEvaluator
 
 PSDLEvaluator = SinglePatientEvaluator
 
@@ -24,9 +19,9 @@ PSDLEvaluator = SinglePatientEvaluator
 class TestAKIDetectionScenario:
     """Comprehensive tests for AKI detection scenario."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
-        """Load the AKI detection scenario."""
+        """Load the AKI detection scenario once per test class."""
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
 
@@ -154,7 +149,7 @@ class TestAKIDetectionScenario:
 class TestICUDeteriorationScenario:
     """Comprehensive tests for ICU deterioration scenario."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/icu_deterioration.yaml")
@@ -252,7 +247,7 @@ class TestICUDeteriorationScenario:
 class TestSepsisScreeningScenario:
     """Comprehensive tests for sepsis screening scenario."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/sepsis_screening.yaml")
@@ -327,9 +322,9 @@ class TestSepsisScreeningScenario:
 class TestTemporalOperatorEdgeCases:
     """Test edge cases for temporal operators in scenarios."""
 
-    @pytest.fixture
-    def delta_scenario_yaml(self, tmp_path):
-        """v0.3: trends produce numeric, logic handles comparisons."""
+    @pytest.fixture(scope="class")
+    def delta_scenario(self):
+        """v0.3: trends produce numeric, logic handles comparisons (parsed once)."""
         content = """
 scenario: Delta_Test
 version: "0.3.0"
@@ -359,14 +354,11 @@ logic:
     when: rising_fast
     severity: high
 """
-        f = tmp_path / "delta_test.yaml"
-        f.write_text(content)
-        return str(f)
+        return PSDLParser().parse_string(content)
 
-    def test_delta_with_exact_window(self, delta_scenario_yaml):
+    def test_delta_with_exact_window(self, delta_scenario):
         """Test delta calculation with data at exact window boundaries."""
-        parser = PSDLParser()
-        scenario = parser.parse_file(delta_scenario_yaml)
+        scenario = delta_scenario
         backend = InMemoryBackend()
 
         now = datetime.now()
@@ -387,10 +379,9 @@ logic:
         assert result.is_triggered
         assert "acute_rise" in result.triggered_logic
 
-    def test_delta_with_sparse_data(self, delta_scenario_yaml):
+    def test_delta_with_sparse_data(self, delta_scenario):
         """Test delta with data points not at window boundaries."""
-        parser = PSDLParser()
-        scenario = parser.parse_file(delta_scenario_yaml)
+        scenario = delta_scenario
         backend = InMemoryBackend()
 
         now = datetime.now()
@@ -413,7 +404,7 @@ logic:
         # Delta should be calculated from data within window
         print(f"Sparse data result: {result.trend_values}")
 
-    def test_slope_calculation(self, tmp_path):
+    def test_slope_calculation(self):
         """Test slope operator for trend detection (v0.3 syntax)."""
         content = """
 scenario: Slope_Test
@@ -443,11 +434,9 @@ logic:
     when: falling_trend
     severity: low
 """
-        f = tmp_path / "slope_test.yaml"
-        f.write_text(content)
 
         parser = PSDLParser()
-        scenario = parser.parse_file(str(f))
+        scenario = parser.parse_string(content)
         backend = InMemoryBackend()
 
         now = datetime.now()
@@ -476,7 +465,7 @@ logic:
 class TestBatchEvaluation:
     """Test evaluating multiple patients in batch."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scenario(self):
         parser = PSDLParser()
         return parser.parse_file("examples/aki_detection.yaml")
@@ -527,7 +516,7 @@ class TestBatchEvaluation:
 class TestScenarioValidation:
     """Test scenario validation and error handling."""
 
-    def test_invalid_signal_reference_in_trend(self, tmp_path):
+    def test_invalid_signal_reference_in_trend(self):
         """Scenario with invalid signal reference should fail validation (v0.3 syntax)."""
         content = """
 scenario: Invalid_Test
@@ -551,19 +540,17 @@ logic:
     when: bad_trend
     severity: low
 """
-        f = tmp_path / "invalid.yaml"
-        f.write_text(content)
 
         parser = PSDLParser()
 
         # Parser should raise an error for invalid signal reference
         with pytest.raises(Exception) as exc_info:
-            parser.parse_file(str(f))
+            parser.parse_string(content)
 
         # Error should mention the non-existent signal
         assert "NonExistent" in str(exc_info.value)
 
-    def test_circular_logic_reference(self, tmp_path):
+    def test_circular_logic_reference(self):
         """Scenario with circular logic should be detected (v0.3 syntax)."""
         content = """
 scenario: Circular_Test
@@ -590,13 +577,11 @@ logic:
     when: rule_a
     severity: low
 """
-        f = tmp_path / "circular.yaml"
-        f.write_text(content)
 
         parser = PSDLParser()
         # This might fail at parse or validation time
         try:
-            scenario = parser.parse_file(str(f))
+            scenario = parser.parse_string(content)
             errors = scenario.validate()
             # Should have validation errors for circular reference
             print(f"Circular reference errors: {errors}")